@@ -0,0 +1,208 @@
+"""
+Template augmentation: expand every JSONL record into k templated variants.
+
+    python augment.py wordacy-train.jsonl wordacy-aug.jsonl --k 20 --seed 1
+    python augment.py in.jsonl out.jsonl --templates my_templates.json \\
+        --slot 'question="(?P<word>[^"]+)"' 'answer=(?P<text>.+)' --k 10 --no-original
+
+Slots are extracted per record: every --slot is field=regex, and each named
+group that matches becomes a slot (the first match of a name wins). The
+record's own non-empty string fields are slots too, under their field names.
+A template is a dict of output field -> str.format template over slots; it
+applies to a record when all its slots are present. For each record, k of
+the applicable templates are picked with a seeded RNG (all of them if fewer),
+so the output is a pure function of the input, templates and seed.
+
+Records are streamed: nothing but the current chunk is held in memory, and
+templates are compiled once into JSON-escaped format strings
+(json_templates.compile_record_template), so a variant costs one format_map().
+
+The defaults (WORDACY_SLOTS, WORDACY_TEMPLATES) fit the wordacy-train.jsonl
+schemas: the headword in quotes, the defining sentence and its gloss (the
+part after "is" / "are" / "means"), and the verb / meaning / example fields
+of the phrasal verb records.
+"""
+import argparse
+import json
+import random
+import re
+import time
+from pathlib import Path
+from string import Formatter
+from typing import Dict, Iterable, Iterator, List, Sequence, Tuple
+
+from json_templates import compile_record_template, json_escape
+from jsonl_reader import get_loads, iter_lines
+from token_count import iter_chunks
+
+_HEADWORD = r'"(?P<word>[^"]+)"'
+_TEXT = r"^(?P<text>.+)$"
+_GLOSS = r"\b(?:is|are|means)\s+(?P<gloss>.+?)\.?$"
+
+WORDACY_SLOTS: Tuple[Tuple[str, str], ...] = (
+    ("question", _HEADWORD),
+    ("definition", _HEADWORD),
+    ("meaning", _HEADWORD),
+    ("answer", _TEXT),
+    ("example", _TEXT),
+    ("answer", _GLOSS),
+    ("example", _GLOSS),
+)
+
+
+def _qa(question: str, answer: str) -> Dict[str, str]:
+    return {"context": "", "question": question, "answer": answer}
+
+
+WORDACY_TEMPLATES: List[Dict[str, str]] = [
+    _qa("Meaning of \"{word}\" in English", "{text}"),
+    _qa("What does \"{word}\" mean?", "{text}"),
+    _qa("Define \"{word}\".", "{text}"),
+    _qa("What is the meaning of the word \"{word}\"?", "{text}"),
+    _qa("Explain \"{word}\" in simple English.", "{text}"),
+    _qa("Give a definition of \"{word}\".", "{text}"),
+    _qa("What is meant by \"{word}\"?", "{text}"),
+    _qa("Describe what \"{word}\" means.", "{text}"),
+    _qa("Tell me the meaning of \"{word}\".", "{text}"),
+    _qa("How would you define \"{word}\"?", "{text}"),
+    _qa("In English, what does \"{word}\" mean?", "{text}"),
+    _qa("What does the English word \"{word}\" refer to?", "{text}"),
+    _qa("Explain the word \"{word}\" to a learner of English.", "{text}"),
+    _qa("What is \"{word}\"?", "{text}"),
+    _qa("Give me the definition of \"{word}\" in one sentence.", "{text}"),
+
+    _qa("Which word means \"{gloss}\"?", "{word}"),
+    _qa("What is the English word for \"{gloss}\"?", "{word}"),
+    _qa("Give me one word or phrase that means \"{gloss}\".", "{word}"),
+    _qa("Complete the definition of \"{word}\": it is ...", "{gloss}"),
+    _qa("In a few words, what is \"{word}\"?", "{gloss}"),
+
+    # phrasal verb records: the raw verb / meaning / example fields
+    _qa("What does the phrasal verb \"{verb}\" mean?", "{meaning}"),
+    _qa("Explain \"{verb}\".", "{meaning}"),
+    _qa("What is the meaning of \"{verb}\"?", "{meaning}"),
+    _qa("Which phrasal verb means \"{meaning}\"?", "{verb}"),
+    _qa("What does \"{verb}\" mean in this sentence: {example}", "{meaning}"),
+    _qa("Use \"{verb}\" in a sentence.", "{example}"),
+    _qa("Give an example sentence with the phrasal verb \"{verb}\".", "{example}"),
+    _qa("Which phrasal verb is used in this sentence: {example}", "{verb}"),
+]
+
+
+def compile_slots(specs: Iterable[Tuple[str, str]]) -> List[Tuple[str, "re.Pattern"]]:
+    return [(field, re.compile(rx)) for field, rx in specs]
+
+
+def parse_slot_specs(specs: Sequence[str]) -> List[Tuple[str, str]]:
+    # ['question="(?P<word>[^"]+)"'] -> [("question", '"(?P<word>[^"]+)"')]
+    out = []
+    for spec in specs:
+        field, sep, rx = spec.partition("=")
+        if not sep or not field:
+            raise ValueError(f"bad slot {spec!r}, expected field=regex")
+        out.append((field, rx))
+    return out
+
+
+def extract_slots(obj: dict, slot_specs: List[Tuple[str, "re.Pattern"]]) -> Dict[str, str]:
+    slots: Dict[str, str] = {}
+    for field, rx in slot_specs:
+        value = obj.get(field)
+        if not value or not isinstance(value, str):
+            continue
+        m = rx.search(value)
+        if m is not None:
+            for name, v in m.groupdict().items():
+                if v is not None and name not in slots:
+                    slots[name] = v
+    for field, value in obj.items():
+        if value and isinstance(value, str) and field not in slots:
+            slots[field] = value
+    return slots
+
+
+class Augmenter:
+
+    def __init__(self, templates: Sequence[Dict[str, str]] = WORDACY_TEMPLATES,
+                 slots: Iterable[Tuple[str, str]] = WORDACY_SLOTS, k: int = 10, seed: int = 0):
+        self.templates = list(templates)
+        self.compiled = [compile_record_template(t) for t in self.templates]
+        # slots each template needs, to find the applicable ones
+        self.required = [frozenset(f for v in t.values() for _, f, _, _ in Formatter().parse(v) if f is not None)
+                         for t in self.templates]
+        self.slot_specs = compile_slots(slots)
+        self.k = k
+        self.rng = random.Random(seed)
+        self._applicable: Dict[frozenset, List[int]] = {}
+        self.stats = {"records": 0, "variants": 0, "no_template": 0}
+
+    def applicable(self, names: frozenset) -> List[int]:
+        hit = self._applicable.get(names)
+        if hit is None:
+            hit = self._applicable[names] = [i for i, req in enumerate(self.required) if req <= names]
+        return hit
+
+    def expand(self, obj: dict) -> List[str]:
+        # JSONL lines of the sampled variants of one record
+        slots = extract_slots(obj, self.slot_specs)
+        choices = self.applicable(frozenset(slots))
+        self.stats["records"] += 1
+        if not choices:
+            self.stats["no_template"] += 1
+            return []
+        picked = choices if len(choices) <= self.k else self.rng.sample(choices, self.k)
+        escaped = {name: json_escape(v) for name, v in slots.items()}
+        self.stats["variants"] += len(picked)
+        return [self.compiled[i].format_map(escaped) for i in picked]
+
+    def iter_lines(self, lines: Iterable[bytes], keep_original: bool = True) -> Iterator[str]:
+        loads = get_loads()
+        for line in lines:
+            if keep_original:
+                yield line.decode("utf-8") + "\n"
+            yield from self.expand(loads(line))
+
+
+def load_templates(path: str) -> List[Dict[str, str]]:
+    # a JSON list of {"<output field>": "<template>", ...}
+    templates = json.loads(Path(path).read_text(encoding="utf-8"))
+    if not isinstance(templates, list) or not all(isinstance(t, dict) for t in templates):
+        raise ValueError(f"{path}: expected a JSON list of objects")
+    return templates
+
+
+def augment_jsonl(in_path: str, out_path: str, augmenter: Augmenter, keep_original: bool = True,
+                  chunk_lines: int = 4096) -> dict:
+    t0 = time.perf_counter()
+    lines = 0
+    with open(out_path, "w", encoding="utf-8") as f:
+        for chunk in iter_chunks(augmenter.iter_lines(iter_lines(in_path), keep_original), chunk_lines):
+            f.write("".join(chunk))
+            lines += len(chunk)
+    dt = time.perf_counter() - t0
+    stats = dict(augmenter.stats)
+    stats["lines"] = lines
+    stats["seconds"] = round(dt, 3)
+    stats["lines_per_s"] = round(lines / dt) if dt > 0 else 0
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("path")
+    parser.add_argument("out")
+    parser.add_argument("--templates", help="JSON list of templates (default: WORDACY_TEMPLATES)")
+    parser.add_argument("--slot", nargs="*", help="field=regex with named groups (default: WORDACY_SLOTS)")
+    parser.add_argument("--k", type=int, default=10, help="variants per record")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--no-original", action="store_true", help="do not copy the input records")
+    args = parser.parse_args()
+
+    templates = load_templates(args.templates) if args.templates else WORDACY_TEMPLATES
+    slots = parse_slot_specs(args.slot) if args.slot else WORDACY_SLOTS
+    augmenter = Augmenter(templates, slots, args.k, args.seed)
+    print(json.dumps(augment_jsonl(args.path, args.out, augmenter, not args.no_original)))
+
+
+if __name__ == "__main__":
+    main()
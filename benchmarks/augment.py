@@ -0,0 +1,46 @@
+"""
+Template augmentation throughput against plain JSONL writing of the same
+records (json.dumps per record, the way generate.py used to write).
+
+    python -m benchmarks.augment wordacy-train.jsonl --k 10 20 50
+"""
+import argparse
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from augment import Augmenter, augment_jsonl
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("path")
+    parser.add_argument("--k", type=int, nargs="+", default=[10, 20, 50])
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        out = str(Path(tmp) / "augmented.jsonl")
+        plain = str(Path(tmp) / "plain.jsonl")
+        for k in args.k:
+            stats = augment_jsonl(args.path, out, Augmenter(k=k, seed=args.seed))
+
+            # the same records, already in memory, written with json.dumps
+            with open(out, encoding="utf-8") as f:
+                records = [json.loads(line) for line in f]
+            t0 = time.perf_counter()
+            with open(plain, "w", encoding="utf-8") as f:
+                for obj in records:
+                    f.write(json.dumps(obj, ensure_ascii=False) + "\n")
+            dt = time.perf_counter() - t0
+
+            print(f"k={k:<4} {stats['lines']:9d} lines ({stats['lines'] / stats['records']:5.1f}x), "
+                  f"{os.path.getsize(out) / 1e6:7.1f} MB")
+            print(f"  {'augment (read + expand + write)':<34} {stats['seconds']:8.3f}s {stats['lines_per_s']:10d} lines/s")
+            print(f"  {'json.dumps write only':<34} {dt:8.3f}s {len(records) / dt:10.0f} lines/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+JSONL vs Parquet vs Arrow stream: file size, full scans, one-column scans and
+per-column token stats.
+
+    python -m benchmarks.columnar verbs_sft.jsonl --tokenizer tiktoken
+"""
+import argparse
+import os
+import tempfile
+import time
+from pathlib import Path
+
+import columnar
+from jsonl_reader import iter_jsonl
+from jsonl_stats import compute_stats
+
+
+def bench(name: str, fn, baseline: float | None = None) -> float:
+    t0 = time.perf_counter()
+    n = fn()
+    dt = time.perf_counter() - t0
+    speedup = f"{baseline / dt:6.1f}x" if baseline else ""
+    print(f"{name:<30} {dt:8.3f}s {n / dt:12.0f} records/s {speedup}")
+    return dt
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("path")
+    parser.add_argument("--tokenizer", default="gpt2")
+    parser.add_argument("--column", default="answer", help="column for the one-column scan")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        outs = [str(Path(tmp) / "data.parquet"), str(Path(tmp) / "data.arrows")]
+        size = os.path.getsize(args.path)
+        print(f"{'jsonl':<30} {size:12d} bytes")
+        for out in outs:
+            columnar.export_jsonl(args.path, out)
+            report = columnar.check_equivalent(args.path, out)
+            assert report["mismatches"] == 0, report
+            out_size = os.path.getsize(out)
+            print(f"{Path(out).suffix:<30} {out_size:12d} bytes  ({size / out_size:.1f}x smaller)")
+
+        base = bench("jsonl full scan", lambda: sum(1 for _ in iter_jsonl(args.path)))
+        for out in outs:
+            bench(f"{Path(out).suffix} full scan", lambda: sum(1 for _ in columnar.iter_records(out)), base)
+
+        base = bench(f"jsonl '{args.column}' scan", lambda: sum(1 for _ in iter_jsonl(args.path, (args.column,))))
+        for out in outs:
+            cols = columnar._physical([args.column])
+            bench(f"{Path(out).suffix} '{args.column}' scan",
+                  lambda: sum(len(columnar.column_values(b, args.column)) for b in columnar.iter_batches(out, cols)),
+                  base)
+
+        n = sum(1 for _ in iter_jsonl(args.path))
+        base = bench("jsonl token stats", lambda: (compute_stats(args.path, args.tokenizer), n)[1])
+        for out in outs:
+            bench(f"{Path(out).suffix} column token stats",
+                  lambda: (columnar.column_token_stats(out, args.tokenizer), n)[1], base)
+
+
+if __name__ == "__main__":
+    main()
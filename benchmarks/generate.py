@@ -0,0 +1,50 @@
+"""
+Rendering throughput (per-record json.dumps vs compiled templates) and
+generate_jsonl() throughput vs number of worker processes.
+
+    python -m benchmarks.generate --repeat 100 --workers 1 2 4 8
+"""
+import argparse
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from generate import IRREGULARS, VERBS, generate_jsonl, iter_records, render_block
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=100, help="replicate the verb list N times")
+    parser.add_argument("--workers", type=int, nargs="*", default=[0, 1, 2, os.cpu_count() or 1])
+    parser.add_argument("--batch-verbs", type=int, default=256)
+    args = parser.parse_args()
+
+    verbs = sorted(VERBS) * args.repeat
+
+    t0 = time.perf_counter()
+    expected = "".join(json.dumps(rec, ensure_ascii=False) + "\n" for rec in iter_records(verbs, IRREGULARS))
+    dt_dumps = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    rendered = render_block(verbs, IRREGULARS)
+    dt_compiled = time.perf_counter() - t0
+    assert rendered == expected, "compiled templates are not byte-identical to json.dumps"
+
+    n = expected.count("\n")
+    print(f"json.dumps per record  {n / dt_dumps:12.0f} records/s")
+    print(f"compiled templates     {n / dt_compiled:12.0f} records/s  speedup = {dt_dumps / dt_compiled:5.2f}x")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        out = str(Path(tmp) / "verbs_sft.jsonl")
+        base = None
+        for w in args.workers:
+            t0 = time.perf_counter()
+            n = generate_jsonl(verbs, out, IRREGULARS, args.batch_verbs, w)
+            dt = time.perf_counter() - t0
+            base = base or dt
+            print(f"workers = {w:<3} {n / dt:12.0f} records/s  speedup = {base / dt:5.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+Inflection helpers: per-call regex (previous implementation) vs precompiled
+suffix rules + LRU cache, and build_forms() loop vs build_forms_batch().
+Also checks the regular rules against generate.RULE_CASES and the IRREGULARS
+table and exits non-zero on a mismatch.
+
+    python -m benchmarks.inflection --repeat 200
+"""
+import argparse
+import re
+import sys
+import time
+
+import generate
+from generate import IRREGULARS, VERBS, build_forms, build_forms_batch, check_regular_rules
+
+
+def _regex_s3(base: str) -> str:
+    if re.search(r"(s|x|z|ch|sh)$", base):
+        return base + "es"
+    if re.search(r"[^aeiou]y$", base):
+        return base[:-1] + "ies"
+    if base.endswith("o"):
+        return base + "es"
+    return base + "s"
+
+
+def _regex_past(base: str) -> str:
+    if base.endswith("e"):
+        return base + "d"
+    if re.search(r"[^aeiou]y$", base):
+        return base[:-1] + "ied"
+    return base + "ed"
+
+
+def bench(name: str, fn, n: int) -> None:
+    t0 = time.perf_counter()
+    fn()
+    dt = time.perf_counter() - t0
+    print(f"{name:<28} {dt:8.4f}s {n / dt:14.0f} calls/s")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    errors = check_regular_rules(IRREGULARS)
+    errors += [f"{v}: build_forms_batch differs" for v, f in
+               zip(VERBS, build_forms_batch(VERBS, IRREGULARS)) if f != build_forms(v, IRREGULARS)]
+    for e in errors:
+        print(e)
+    print(f"correctness: {len(errors)} mismatches over {len(IRREGULARS)} table entries")
+
+    verbs = list(IRREGULARS) * args.repeat
+    n = len(verbs)
+    bench("regex s3 + past", lambda: [(_regex_s3(v), _regex_past(v)) for v in verbs], n)
+    generate.third_person_singular.cache_clear()
+    generate.past_tense_regular.cache_clear()
+    bench("suffix rules s3 + past", lambda: [(generate.third_person_singular(v), generate.past_tense_regular(v))
+                                             for v in verbs], n)
+    bench("build_forms loop", lambda: [build_forms(v, IRREGULARS) for v in verbs], n)
+    bench("build_forms_batch", lambda: build_forms_batch(verbs, IRREGULARS), n)
+
+    sys.exit(1 if errors else 0)
+
+
+if __name__ == "__main__":
+    main()
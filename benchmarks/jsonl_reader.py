@@ -0,0 +1,61 @@
+"""
+JSONL parse throughput: stdlib text-mode line loop vs jsonl_reader with every
+installed backend, full records vs only the fields main.main() needs.
+
+    python -m benchmarks.jsonl_reader wordacy-train.jsonl --repeat 20
+"""
+import argparse
+import json
+import time
+
+import jsonl_reader
+from token_count import TEXT_FIELDS
+
+
+def bench(name: str, fn, baseline: float | None = None) -> float:
+    t0 = time.perf_counter()
+    n = fn()
+    dt = time.perf_counter() - t0
+    speedup = f"{baseline / dt:6.1f}x" if baseline else ""
+    print(f"{name:<26} {dt:8.3f}s {n / dt:12.0f} records/s {speedup}")
+    return dt
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("path")
+    parser.add_argument("--repeat", type=int, default=10, help="read the file N times")
+    args = parser.parse_args()
+
+    def stdlib_lines() -> int:
+        n = 0
+        for _ in range(args.repeat):
+            with open(args.path, "r", encoding="utf-8") as f:
+                for line in f:
+                    line = line.strip()
+                    if line:
+                        json.loads(line)
+                        n += 1
+        return n
+
+    def reader(fields) -> int:
+        n = 0
+        for _ in range(args.repeat):
+            for _ in jsonl_reader.iter_jsonl(args.path, fields):
+                n += 1
+        return n
+
+    base = bench("stdlib text lines", stdlib_lines)
+    for backend in jsonl_reader.BACKENDS:
+        try:
+            jsonl_reader.set_backend(backend)
+        except ImportError:
+            print(f"{backend:<26} not installed")
+            continue
+        bench(f"{backend} blocks", lambda: reader(None), base)
+        bench(f"{backend} blocks, 2 fields", lambda: reader(TEXT_FIELDS), base)
+    jsonl_reader.set_backend()
+
+
+if __name__ == "__main__":
+    main()
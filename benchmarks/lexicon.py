@@ -0,0 +1,79 @@
+"""
+Dict-of-dicts irregulars table vs the mmap lexicon: memory footprint and
+forward / reverse lookup latency, on IRREGULARS scaled up to --lemmas entries.
+
+    python -m benchmarks.lexicon --lemmas 200000
+"""
+import argparse
+import os
+import random
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+from generate import IRREGULARS
+from lexicon import FORMS, Lexicon, build_lexicon
+
+
+def synthetic_table(n: int) -> dict:
+    # suffix every copy so strings stay distinct, like a real large lexicon
+    table = {}
+    items = list(IRREGULARS.items())
+    for i in range(n):
+        base, forms = items[i % len(items)]
+        tag = f"{i // len(items)}" if i >= len(items) else ""
+        table[base + tag] = {k: v + tag for k, v in forms.items()}
+    return table
+
+
+def timed_lookups(name: str, fn, keys: list) -> None:
+    t0 = time.perf_counter()
+    for k in keys:
+        fn(k)
+    dt = time.perf_counter() - t0
+    print(f"{name:<28} {dt / len(keys) * 1e9:8.0f} ns/lookup")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--lemmas", type=int, default=200_000)
+    parser.add_argument("--lookups", type=int, default=200_000)
+    args = parser.parse_args()
+
+    source = synthetic_table(args.lemmas)
+    keys = random.Random(0).choices(list(source), k=args.lookups)
+    form_keys = [source[k]["past"] for k in keys]
+
+    tracemalloc.start()
+    table = {k: dict(v) for k, v in source.items()}
+    reverse = {}
+    for base, forms in table.items():
+        for slot in FORMS:
+            reverse.setdefault(forms[slot], []).append((base, slot))
+    dict_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = str(Path(tmp) / "bench.lex")
+        t0 = time.perf_counter()
+        build_lexicon(source, path)
+        print(f"build lexicon                {time.perf_counter() - t0:8.3f}s")
+
+        tracemalloc.start()
+        lex = Lexicon(path)
+        lex_heap = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+
+        print(f"dict + reverse dict          {dict_bytes / 1e6:8.1f} MB heap")
+        print(f"lexicon                      {os.path.getsize(path) / 1e6:8.1f} MB mapped, {lex_heap / 1e3:.1f} KB heap")
+
+        timed_lookups("dict forward", table.get, keys)
+        timed_lookups("lexicon forward", lex.get, keys)
+        timed_lookups("dict reverse", reverse.get, form_keys)
+        timed_lookups("lexicon reverse", lex.lemmas, form_keys)
+        lex.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,189 @@
+"""
+Reproducible dataset-build and tokenization benchmark suite.
+
+Builds seeded synthetic corpora of --records records in a temp dir (verbs
+through TEMPLATES, wordacy-style qa and definition records, "<X> is ..." text)
+and times each stage, best of --repeat:
+
+    generate         generate_jsonl() over synthetic verbs
+    parse            jsonl_reader.iter_jsonl() over the wordacy-style JSONL
+    parse_fields     the same, decoding only "definition" and "example"
+    tokens_gpt2      batched token counting, gpt2 backend
+    tokens_tiktoken  batched token counting, tiktoken backend
+    convert          txt_convert.convert_file() over the text corpus
+
+Backends that cannot load (not installed, no local tokenizer files and no
+network) are reported as skipped, so the suite always runs offline on CPU.
+Results are compared as records/s, so baselines taken at another --records
+still mean something.
+
+    python -m benchmarks.suite --records 200000 --save-baseline benchmarks/baseline.json
+    python -m benchmarks.suite --records 200000 --baseline benchmarks/baseline.json --threshold 0.2
+"""
+import argparse
+import contextlib
+import io
+import json
+import platform
+import random
+import string
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Dict, List
+
+from encoders import get_backend
+import jsonl_reader
+from generate import IRREGULARS, TEMPLATES, VERBS, generate_jsonl
+from token_count import TEXT_FIELDS, count_tokens, record_text
+from txt_convert import convert_file
+
+
+# --------- synthetic corpora ---------
+
+def _word(rng: random.Random) -> str:
+    return "".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(3, 10)))
+
+
+def synthetic_verbs(n: int, rng: random.Random) -> List[str]:
+    # the real verbs first (irregular forms), then made-up regular ones
+    verbs = sorted(VERBS)[:n]
+    while len(verbs) < n:
+        verbs.append(_word(rng))
+    return verbs
+
+
+def write_wordacy_jsonl(path: Path, n: int, rng: random.Random) -> None:
+    # same mix of schemas as wordacy-train.jsonl: qa, definition, meaning
+    with path.open("w", encoding="utf-8") as f:
+        for i in range(n):
+            w = _word(rng)
+            body = " ".join(_word(rng) for _ in range(rng.randint(4, 20)))
+            kind = i % 3
+            if kind == 0:
+                rec = {"context": "", "question": f'Meaning of "{w}" in English', "answer": f"A {w} is {body}."}
+            elif kind == 1:
+                rec = {"verb": "", "definition": f'definition of "{w}"', "example": f"The {w} is {body}."}
+            else:
+                rec = {"verb": w, "meaning": "", "example": f"They {w} {body}."}
+            f.write(json.dumps(rec, ensure_ascii=False) + "\n")
+
+
+def write_text(path: Path, n: int, rng: random.Random) -> None:
+    # two thirds convertible lines, one third rejects
+    with path.open("w", encoding="utf-8") as f:
+        for i in range(n):
+            words = " ".join(_word(rng) for _ in range(rng.randint(5, 25)))
+            f.write(f"{_word(rng).capitalize()} is {words}.\n" if i % 3 else f"{words}.\n")
+
+
+# --------- stages ---------
+
+def best_of(fn: Callable[[], int], repeat: int) -> Dict[str, float]:
+    best = float("inf")
+    records = 0
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        records = fn()
+        best = min(best, time.perf_counter() - t0)
+    return {"seconds": round(best, 6), "records": records, "records_per_s": round(records / best, 1) if best else 0.0}
+
+
+def run_suite(records: int, repeat: int, seed: int) -> dict:
+    rng = random.Random(seed)
+    results: Dict[str, dict] = {}
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        verbs = synthetic_verbs(max(records // len(TEMPLATES), 1), rng)
+        wordacy = tmp / "wordacy.jsonl"
+        text = tmp / "text.txt"
+        write_wordacy_jsonl(wordacy, records, rng)
+        write_text(text, records, rng)
+
+        def stage_generate() -> int:
+            with contextlib.redirect_stdout(io.StringIO()):
+                return generate_jsonl(verbs, str(tmp / "verbs_sft.jsonl"), IRREGULARS)
+
+        results["generate"] = best_of(stage_generate, repeat)
+        results["parse"] = best_of(lambda: sum(1 for _ in jsonl_reader.iter_jsonl(wordacy)), repeat)
+        results["parse_fields"] = best_of(lambda: sum(1 for _ in jsonl_reader.iter_jsonl(wordacy, TEXT_FIELDS)), repeat)
+
+        with wordacy.open("r", encoding="utf-8") as f:
+            texts = [record_text(obj) or obj.get("answer", "") for obj in map(json.loads, f)]
+        for backend in ("gpt2", "tiktoken"):
+            try:
+                get_backend(backend)
+            except Exception as e:  # missing package, no cached files and no network, ...
+                results[f"tokens_{backend}"] = {"skipped": f"{type(e).__name__}: {e}"}
+                continue
+            results[f"tokens_{backend}"] = best_of(lambda: count_tokens(texts, backend)[1], repeat)
+
+        results["convert"] = best_of(lambda: convert_file(str(text), str(tmp / "text.jsonl"))["lines"], repeat)
+
+    return {
+        "meta": {
+            "records": records,
+            "repeat": repeat,
+            "seed": seed,
+            "json_backend": jsonl_reader.BACKEND,
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "platform": platform.platform(),
+        },
+        "results": results,
+    }
+
+
+def compare(current: dict, baseline: dict, threshold: float) -> List[str]:
+    """
+    Returns the stages whose records/s dropped by more than threshold
+    (0.2 = 20% slower) against the baseline.
+    """
+    regressions = []
+    print(f"{'stage':<18} {'baseline rec/s':>16} {'current rec/s':>16} {'change':>8}")
+    for stage, cur in current["results"].items():
+        base = baseline.get("results", {}).get(stage)
+        if not base or "skipped" in cur or "skipped" in base:
+            print(f"{stage:<18} {'-':>16} {cur.get('records_per_s', '-'):>16} {'n/a':>8}")
+            continue
+        change = cur["records_per_s"] / base["records_per_s"] - 1 if base["records_per_s"] else 0.0
+        flag = ""
+        if change < -threshold:
+            regressions.append(stage)
+            flag = "  REGRESSION"
+        print(f"{stage:<18} {base['records_per_s']:>16.0f} {cur['records_per_s']:>16.0f} {change:>+8.1%}{flag}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--records", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", help="write results JSON here")
+    parser.add_argument("--baseline", help="compare against this results JSON")
+    parser.add_argument("--save-baseline", help="write results JSON as the new baseline")
+    parser.add_argument("--threshold", type=float, default=0.2)
+    args = parser.parse_args()
+
+    current = run_suite(args.records, args.repeat, args.seed)
+    text = json.dumps(current, indent=2)
+    for path in (args.out, args.save_baseline):
+        if path:
+            Path(path).write_text(text + "\n", encoding="utf-8")
+
+    if not args.baseline:
+        print(text)
+        return
+
+    baseline = json.loads(Path(args.baseline).read_text(encoding="utf-8"))
+    regressions = compare(current, baseline, args.threshold)
+    if regressions:
+        print(f"regressions over {args.threshold:.0%}: {', '.join(regressions)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""
+Per-line vs batched vs multi-process token counting throughput.
+
+    python -m benchmarks.token_count wordacy-train.jsonl --tokenizer tiktoken --workers 4
+"""
+import argparse
+import os
+import time
+
+from encoders import get_backend, get_token_encoder
+from token_count import count_tokens, iter_record_texts
+
+
+def bench(name: str, fn, n_texts: int) -> tuple:
+    t0 = time.perf_counter()
+    result = fn()
+    dt = time.perf_counter() - t0
+    rate = n_texts / dt if dt > 0 else float("inf")
+    print(f"{name:<24} {dt:8.3f}s {rate:12.0f} texts/s  -> {result}")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("path")
+    parser.add_argument("--tokenizer", default="gpt2")
+    parser.add_argument("--chunk-size", type=int, default=1024)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--repeat", type=int, default=1, help="replicate the corpus N times in memory")
+    args = parser.parse_args()
+
+    texts = list(iter_record_texts(args.path)) * args.repeat
+    print(f"{len(texts)} texts, tokenizer = {args.tokenizer}")
+    get_backend(args.tokenizer)  # keep tokenizer load time out of the numbers
+
+    def per_line():
+        enc = get_token_encoder(args.tokenizer)
+        total = longest = 0
+        for s in texts:
+            n = enc(s)
+            total += n
+            longest = max(longest, n)
+        return total, len(texts), longest
+
+    baseline = bench("per-line", per_line, len(texts))
+    batched = bench("batched", lambda: count_tokens(texts, args.tokenizer, args.chunk_size), len(texts))
+    parallel = bench(f"batched x{args.workers} procs",
+                     lambda: count_tokens(texts, args.tokenizer, args.chunk_size, args.workers), len(texts))
+
+    assert baseline == batched == parallel, "token totals differ between strategies"
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""
+Re-tokenizing JSONL every epoch vs slicing a memory-mapped pre-tokenized export.
+
+    python -m benchmarks.token_dataset wordacy-train.jsonl --tokenizer tiktoken --epochs 3
+"""
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from encoders import get_backend
+from jsonl_stats import iter_records
+from token_dataset import TokenDataset, export_jsonl, split_record
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("path")
+    parser.add_argument("--tokenizer", default="gpt2")
+    parser.add_argument("--epochs", type=int, default=3)
+    args = parser.parse_args()
+
+    backend = get_backend(args.tokenizer)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        out = str(Path(tmp) / "data")
+
+        t0 = time.perf_counter()
+        meta = export_jsonl(args.path, out, args.tokenizer)
+        print(f"export            {time.perf_counter() - t0:8.3f}s  ({meta['records']} records, {meta['tokens']} tokens)")
+
+        t0 = time.perf_counter()
+        for _ in range(args.epochs):
+            n = 0
+            for obj in iter_records(args.path):
+                prompt, target = split_record(obj)
+                n += len(backend.encode(prompt)) + len(backend.encode(target))
+        dt_jsonl = time.perf_counter() - t0
+        print(f"jsonl x{args.epochs} epochs   {dt_jsonl:8.3f}s  ({n} tokens/epoch)")
+
+        t0 = time.perf_counter()
+        with TokenDataset(out) as ds:
+            for _ in range(args.epochs):
+                n = 0
+                for i in range(len(ds)):
+                    n += len(ds[i])
+        dt_mmap = time.perf_counter() - t0
+        print(f"mmap  x{args.epochs} epochs   {dt_mmap:8.3f}s  ({n} tokens/epoch)")
+        print(f"speedup           {dt_jsonl / dt_mmap:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
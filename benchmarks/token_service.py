@@ -0,0 +1,100 @@
+"""
+Token service under concurrent load: throughput and latency percentiles of
+single-text count requests from N client threads, against in-process
+single-item encodes (what every job does with get_token_encoder() today).
+
+Starts `token_service.py serve` as a subprocess on a temporary Unix socket.
+
+    python -m benchmarks.token_service wordacy-train.jsonl --tokenizer tiktoken --clients 1 8 32
+"""
+import argparse
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import List
+
+from encoders import get_token_encoder
+from token_count import iter_record_texts
+from token_service import TokenClient
+
+
+def percentile(sorted_values: List[float], q: float) -> float:
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(int(len(sorted_values) * q / 100), len(sorted_values) - 1)]
+
+
+def wait_ready(client: TokenClient, proc: subprocess.Popen, timeout: float = 120.0) -> None:
+    t0 = time.perf_counter()
+    while True:
+        try:
+            client.info()
+            return
+        except OSError:
+            if proc.poll() is not None or time.perf_counter() - t0 > timeout:
+                raise RuntimeError("token service did not start")
+            time.sleep(0.05)
+
+
+def load(client: TokenClient, texts: List[str], clients: int) -> tuple:
+    def worker(part: List[str]) -> List[float]:
+        pc = time.perf_counter
+        lat = []
+        for t in part:
+            t0 = pc()
+            client.count([t])
+            lat.append(pc() - t0)
+        return lat
+
+    parts = [texts[i::clients] for i in range(clients)]
+    t0 = time.perf_counter()
+    with ThreadPoolExecutor(clients) as pool:
+        latencies = sorted(x for lat in pool.map(worker, parts) for x in lat)
+    return time.perf_counter() - t0, latencies
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("path")
+    parser.add_argument("--tokenizer", default="gpt2")
+    parser.add_argument("--clients", type=int, nargs="+", default=[1, 8, 32])
+    parser.add_argument("--max-batch", type=int, default=256)
+    parser.add_argument("--max-latency-ms", type=float, default=2.0)
+    args = parser.parse_args()
+
+    texts = list(iter_record_texts(args.path))
+
+    encode = get_token_encoder(args.tokenizer)
+    encode("warm up")
+    t0 = time.perf_counter()
+    for t in texts:
+        encode(t)
+    dt = time.perf_counter() - t0
+    print(f"{'in-process, 1 thread':<24} {dt:8.3f}s {len(texts) / dt:10.0f} req/s")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        address = str(Path(tmp) / "tokens.sock")
+        proc = subprocess.Popen([sys.executable, "token_service.py", "serve", "--address", address,
+                                 "--tokenizers", args.tokenizer, "--max-batch", str(args.max_batch),
+                                 "--max-latency-ms", str(args.max_latency_ms)], stdout=subprocess.DEVNULL)
+        try:
+            client = TokenClient(address, args.tokenizer)
+            wait_ready(client, proc)
+            for n in args.clients:
+                dt, lat = load(client, texts, n)
+                print(f"{f'service, {n} clients':<24} {dt:8.3f}s {len(texts) / dt:10.0f} req/s   "
+                      f"p50 = {percentile(lat, 50) * 1000:6.2f} ms, p99 = {percentile(lat, 99) * 1000:6.2f} ms")
+            stats = client.info()["tokenizers"]
+            for name, st in stats.items():
+                print(f"{name}: {st['requests']} requests in {st['batches']} batches "
+                      f"(mean {st['texts'] / max(st['batches'], 1):.1f} texts, max {st['max_batch_texts']})")
+        finally:
+            proc.terminate()
+            proc.wait()
+
+
+if __name__ == "__main__":
+    main()
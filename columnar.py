@@ -0,0 +1,263 @@
+"""
+Parquet / Arrow export of SFT records, plus a columnar token-stats reader.
+
+    python columnar.py export verbs_sft.jsonl verbs_sft.parquet          # or .arrows (Arrow IPC stream)
+    python columnar.py check verbs_sft.jsonl verbs_sft.parquet           # same records, same order
+    python columnar.py stats verbs_sft.parquet --tokenizer tiktoken
+
+Every field of jsonl_stats.SCHEMAS becomes a nullable string column (null:
+the record has no such field), in COLUMNS order. "question" is stored as two
+columns: question_template, the question with its first quoted word replaced
+by "{}" (dictionary encoded: the 21 verb templates and "Meaning of "{}" in
+English" cover almost every row), and question_slot, the word itself.
+Questions that already contain "{}" or have no quoted word keep a null
+template and the whole text in question_slot.
+
+Parquet files are zstd compressed with one row group per batch_rows records.
+.arrows files are Arrow IPC streams with zstd buffers; streams (unlike the
+IPC file format) allow a new template dictionary per batch, so export stays
+single pass and bounded in memory.
+
+pyarrow is only imported by the functions that need it.
+"""
+import argparse
+import json
+import re
+import time
+from typing import Dict, Iterable, Iterator, List, Sequence, Tuple
+
+from encoders import get_batch_token_encoder
+from jsonl_reader import iter_jsonl
+from jsonl_stats import SCHEMAS, LengthHistogram
+from token_count import iter_chunks
+
+COLUMNS: Tuple[str, ...] = tuple(dict.fromkeys(f for fields, _, _ in SCHEMAS.values() for f in fields))
+QUESTION = "question"
+TEMPLATE = "question_template"
+SLOT = "question_slot"
+SLOT_MARK = "{}"
+FORMAT_VERSION = "1"
+
+_QUOTED = re.compile(r'"([^"]+)"')
+
+
+def _pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.ipc
+        import pyarrow.parquet
+    except ImportError as e:
+        raise ImportError("Parquet/Arrow export needs pyarrow (pip install pyarrow)") from e
+    return pyarrow
+
+
+def split_question(question: str | None) -> Tuple[str | None, str | None]:
+    # 'What is the past tense of the verb "go"?' -> ('What is the past tense of the verb "{}"?', 'go')
+    if question is None or SLOT_MARK in question:
+        return None, question
+    m = _QUOTED.search(question)
+    if m is None:
+        return None, question
+    return question[:m.start(1)] + SLOT_MARK + question[m.end(1):], m.group(1)
+
+
+def join_question(template: str | None, slot: str | None) -> str | None:
+    if template is None:
+        return slot
+    return template.replace(SLOT_MARK, slot, 1)
+
+
+def arrow_schema(columns: Sequence[str] = COLUMNS):
+    pa = _pyarrow()
+    fields = []
+    for name in columns:
+        if name == QUESTION:
+            fields.append(pa.field(TEMPLATE, pa.dictionary(pa.int32(), pa.string())))
+            fields.append(pa.field(SLOT, pa.string()))
+        else:
+            fields.append(pa.field(name, pa.string()))
+    meta = {"wordacy.version": FORMAT_VERSION, "wordacy.columns": json.dumps(list(columns))}
+    return pa.schema(fields, metadata=meta)
+
+
+def record_batch(records: List[dict], schema, columns: Sequence[str] = COLUMNS):
+    pa = _pyarrow()
+    known = set(columns)
+    for obj in records:
+        extra = obj.keys() - known
+        if extra:
+            raise ValueError(f"field(s) {sorted(extra)} not in columns {list(columns)}")
+
+    arrays = []
+    for name in columns:
+        values = [obj.get(name) for obj in records]
+        if name == QUESTION:
+            pairs = [split_question(q) for q in values]
+            arrays.append(pa.array([t for t, _ in pairs], pa.string()).dictionary_encode())
+            arrays.append(pa.array([s for _, s in pairs], pa.string()))
+        else:
+            arrays.append(pa.array(values, pa.string()))
+    return pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+
+def export_records(records: Iterable[dict], out_path: str, columns: Sequence[str] = COLUMNS,
+                   batch_rows: int = 65536, compression: str = "zstd") -> int:
+    """
+    Writes records to out_path (.parquet, or .arrows for an Arrow IPC stream)
+    and returns how many were written.
+    """
+    pa = _pyarrow()
+    schema = arrow_schema(columns)
+    if out_path.endswith(".arrows"):
+        options = pa.ipc.IpcWriteOptions(compression=compression)
+        writer = pa.ipc.new_stream(out_path, schema, options=options)
+        write = writer.write_batch
+    else:
+        writer = pa.parquet.ParquetWriter(out_path, schema, compression=compression)
+        write = lambda batch: writer.write_table(pa.Table.from_batches([batch], schema))
+
+    n = 0
+    try:
+        for chunk in iter_chunks(records, batch_rows):
+            write(record_batch(chunk, schema, columns))
+            n += len(chunk)
+    finally:
+        writer.close()
+    return n
+
+
+def export_jsonl(in_path: str, out_path: str, columns: Sequence[str] = COLUMNS,
+                 batch_rows: int = 65536, compression: str = "zstd") -> int:
+    return export_records(iter_jsonl(in_path), out_path, columns, batch_rows, compression)
+
+
+# --------- reading ---------
+
+def iter_batches(path: str, columns: Sequence[str] | None = None, batch_rows: int = 65536):
+    # physical columns (question_template / question_slot, not question)
+    pa = _pyarrow()
+    if path.endswith(".arrows"):
+        with pa.memory_map(path) as source:
+            for batch in pa.ipc.open_stream(source):
+                yield batch.select(columns) if columns else batch
+    else:
+        f = pa.parquet.ParquetFile(path)
+        yield from f.iter_batches(batch_size=batch_rows, columns=list(columns) if columns else None)
+
+
+def stored_columns(path: str) -> List[str]:
+    pa = _pyarrow()
+    if path.endswith(".arrows"):
+        with pa.memory_map(path) as source:
+            schema = pa.ipc.open_stream(source).schema
+    else:
+        schema = pa.parquet.read_schema(path)
+    return json.loads(schema.metadata[b"wordacy.columns"])
+
+
+def _physical(columns: Sequence[str]) -> List[str]:
+    out = []
+    for name in columns:
+        out.extend((TEMPLATE, SLOT) if name == QUESTION else (name,))
+    return out
+
+
+def column_values(batch, name: str) -> List[str | None]:
+    if name == QUESTION:
+        return [join_question(t, s) for t, s in zip(batch.column(TEMPLATE).to_pylist(),
+                                                     batch.column(SLOT).to_pylist())]
+    return batch.column(name).to_pylist()
+
+
+def iter_records(path: str, batch_rows: int = 65536) -> Iterator[dict]:
+    # the original records: null columns are left out, field order follows COLUMNS
+    columns = stored_columns(path)
+    for batch in iter_batches(path, batch_rows=batch_rows):
+        values = [column_values(batch, name) for name in columns]
+        for row in zip(*values):
+            yield {k: v for k, v in zip(columns, row) if v is not None}
+
+
+def check_equivalent(jsonl_path: str, path: str) -> dict:
+    """
+    Compares both files record by record (as dicts, so key order does not
+    matter). Returns counts and the first differing record number, if any.
+    """
+    report = {"records": 0, "mismatches": 0, "first_mismatch": None}
+    missing = object()
+    left, right = iter_jsonl(jsonl_path), iter_records(path)
+    while True:
+        a, b = next(left, missing), next(right, missing)
+        if a is missing and b is missing:
+            return report
+        report["records"] += 1
+        if a != b:
+            report["mismatches"] += 1
+            if report["first_mismatch"] is None:
+                report["first_mismatch"] = report["records"]
+
+
+def column_token_stats(path: str, tokenizer: str | None = None, columns: Sequence[str] | None = None,
+                       batch_rows: int = 65536) -> Dict[str, LengthHistogram]:
+    """
+    Token length histogram per column, one batch encode per column and batch.
+    Dictionary columns (question_template) encode each dictionary value once
+    and gather the counts by index.
+    """
+    pa = _pyarrow()
+    encode_batch = get_batch_token_encoder(tokenizer)
+    columns = list(columns or stored_columns(path))
+    names = columns + ([TEMPLATE] if QUESTION in columns else [])
+    stats = {name: LengthHistogram() for name in names}
+
+    for batch in iter_batches(path, _physical(columns), batch_rows):
+        for name in names:
+            hist = stats[name]
+            col = batch.column(TEMPLATE) if name == TEMPLATE else None
+            if col is not None and pa.types.is_dictionary(col.type):
+                dict_counts = encode_batch(col.dictionary.to_pylist())
+                for i in col.indices.to_pylist():
+                    if i is not None:
+                        hist.add(dict_counts[i])
+                continue
+            values = col.to_pylist() if col is not None else column_values(batch, name)
+            texts = [v for v in values if v is not None]
+            for n in encode_batch(texts):
+                hist.add(n)
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    sub = parser.add_subparsers(dest="cmd", required=True)
+    p_export = sub.add_parser("export")
+    p_export.add_argument("jsonl")
+    p_export.add_argument("out", help=".parquet or .arrows")
+    p_export.add_argument("--batch-rows", type=int, default=65536)
+    p_export.add_argument("--compression", default="zstd")
+    p_check = sub.add_parser("check")
+    p_check.add_argument("jsonl")
+    p_check.add_argument("path")
+    p_stats = sub.add_parser("stats")
+    p_stats.add_argument("path")
+    p_stats.add_argument("--tokenizer", default="gpt2")
+    p_stats.add_argument("--columns", nargs="*")
+    args = parser.parse_args()
+
+    t0 = time.perf_counter()
+    if args.cmd == "export":
+        n = export_jsonl(args.jsonl, args.out, batch_rows=args.batch_rows, compression=args.compression)
+        print(f"{args.out}: {n} records in {time.perf_counter() - t0:.3f}s")
+    elif args.cmd == "check":
+        report = check_equivalent(args.jsonl, args.path)
+        print(json.dumps(report))
+        if report["mismatches"]:
+            raise SystemExit(1)
+    else:
+        for name, hist in column_token_stats(args.path, args.tokenizer, args.columns).items():
+            print(f"  {name:<18} {json.dumps(hist.to_dict())}")
+        print(f"  {time.perf_counter() - t0:.3f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,274 @@
+"""
+Streaming exact and near-duplicate removal for JSONL datasets.
+
+Exact duplicates: 8-byte blake2b digest of the normalized (lowercased,
+whitespace-collapsed) prompt + answer, kept in a KeyTable (digest -> line).
+
+Near duplicates: MinHash signature of the word shingles of the answer, split
+into LSH bands. With --near-on answer (default) the band keys are scoped by the
+normalized question, so two records collide only if they ask the same thing
+and answer it in similar words ("Meaning of "X" in English" entries). With
+--near-on sequence the whole prompt + answer is shingled, which also catches
+near-identical questions, but it folds templated data such as verbs_sft.jsonl,
+where records differ in a word or two, so use it on free text only.
+
+Records whose band collides with an earlier kept record are dropped; the
+default 64 permutations / 8 bands puts the Jaccard threshold around 0.77.
+Lines that are not JSON objects of a known schema (jsonl_stats.SCHEMAS)
+cannot be compared; they are written through unchanged and counted as
+"unchecked".
+
+Each shingle is hashed once; the num_perm MinHash values are the minima of
+(a * hash + b) mod 2**64 over the shingles, for num_perm fixed (a, b) pairs:
+one vectorized op per record when numpy is installed, the same values from a
+Python loop otherwise.
+
+Only keys are kept in memory, never records: 64-bit digests and band keys go
+into open-addressing array tables (12 bytes per slot, about 150-250 bytes per
+indexed record with the default 8 bands). --max-index caps how many records
+are indexed (default 2M, under 500 MB); later records are still checked
+against the index, just not added. 0 means no cap.
+
+    python dedup.py merged.jsonl merged.dedup.jsonl --report merged.dups.jsonl
+"""
+import argparse
+import hashlib
+import json
+import re
+import time
+from array import array
+from typing import List, Tuple
+
+from jsonl_reader import get_decode_errors, get_loads
+from token_dataset import split_record
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+MAX_INDEX = 2_000_000
+_MASK64 = (1 << 64) - 1
+_WORD = re.compile(r"\w+")
+
+
+def _hash64(s: str) -> int:
+    return int.from_bytes(hashlib.blake2b(s.encode("utf-8"), digest_size=8).digest(), "little")
+
+
+def normalize(text: str) -> str:
+    return " ".join(text.lower().split())
+
+
+def shingles(text: str, size: int = 3) -> set:
+    words = _WORD.findall(text.lower())
+    if len(words) <= size:
+        return {" ".join(words)}
+    return {" ".join(words[i:i + size]) for i in range(len(words) - size + 1)}
+
+
+class MinHasher:
+
+    def __init__(self, num_perm: int = 64, seed: int = 1):
+        # (a * x + b) mod 2**64 permutations (a odd), derived deterministically from the seed
+        self.params: List[Tuple[int, int]] = []
+        for i in range(num_perm):
+            h = hashlib.blake2b(f"{seed}:{i}".encode(), digest_size=16).digest()
+            self.params.append((int.from_bytes(h[:8], "little") | 1, int.from_bytes(h[8:], "little")))
+        if np is not None:
+            self._np_a = np.array([a for a, _ in self.params], np.uint64)[:, None]
+            self._np_b = np.array([b for _, b in self.params], np.uint64)[:, None]
+
+    def signature(self, items: set):
+        # a uint64 array with numpy (one vectorized op per record), else a list of ints
+        hashes = [_hash64(s) for s in items] or [0]
+        if np is not None:
+            return (self._np_a * np.array(hashes, np.uint64) + self._np_b).min(axis=1)
+        return [min([(a * x + b) & _MASK64 for x in hashes]) for a, b in self.params]
+
+
+class KeyTable:
+    """
+    uint64 key -> uint32 line number, open addressing with linear probing in
+    two arrays (12 bytes per slot instead of ~100 per dict entry). Keys are
+    already hashes, so their low bits pick the slot; key 0 marks an empty slot
+    and is stored as 1.
+    """
+
+    def __init__(self, capacity: int = 1 << 16):
+        self.keys = array("Q", bytes(8 * capacity))
+        self.values = array("I", bytes(4 * capacity))
+        self.mask = capacity - 1
+        self.size = 0
+
+    def __len__(self) -> int:
+        return self.size
+
+    def get(self, key: int) -> int | None:
+        key = key or 1
+        keys, mask = self.keys, self.mask
+        i = key & mask
+        while True:
+            k = keys[i]
+            if k == key:
+                return self.values[i]
+            if not k:
+                return None
+            i = (i + 1) & mask
+
+    def add(self, key: int, value: int) -> None:
+        # keeps the first value of a key
+        if (self.size + 1) * 4 > len(self.keys) * 3:
+            self._grow()
+        key = key or 1
+        keys, mask = self.keys, self.mask
+        i = key & mask
+        while True:
+            k = keys[i]
+            if k == key:
+                return
+            if not k:
+                keys[i] = key
+                self.values[i] = value
+                self.size += 1
+                return
+            i = (i + 1) & mask
+
+    def _grow(self) -> None:
+        old = zip(self.keys, self.values)
+        capacity = len(self.keys) * 2
+        self.keys = array("Q", bytes(8 * capacity))
+        self.values = array("I", bytes(4 * capacity))
+        self.mask = capacity - 1
+        self.size = 0
+        for k, v in old:
+            if k:
+                self.add(k, v)
+
+
+class Deduplicator:
+
+    def __init__(self, num_perm: int = 64, bands: int = 8, near_on: str = "answer",
+                 shingle_size: int = 3, max_index: int = MAX_INDEX):
+        if num_perm % bands:
+            raise ValueError(f"num_perm ({num_perm}) must be a multiple of bands ({bands})")
+        self.hasher = MinHasher(num_perm)
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.near_on = near_on
+        self.shingle_size = shingle_size
+        self.max_index = max_index
+
+        # band key = sum of the band's signature values times odd constants, plus scope and band (mod 2**64)
+        self.multipliers = [_hash64(f"row:{j}") | 1 for j in range(self.rows)]
+        if np is not None:
+            self._np_multipliers = np.array(self.multipliers, np.uint64)
+            self._np_bands = np.arange(bands, dtype=np.uint64)
+
+        self.exact = KeyTable()   # digest -> first line number
+        self.lsh = KeyTable()     # band key -> first line number
+        self.indexed = 0
+
+    def check(self, line_no: int, obj: dict) -> Tuple[str, int] | None:
+        """
+        Returns None for a new record (and indexes it), or (kind, line number
+        of the kept record) for a duplicate. Raises ValueError for a record of
+        no known schema.
+        """
+        if not isinstance(obj, dict):
+            raise ValueError("not a JSON object")
+        prompt, answer = split_record(obj)
+        prompt_n, answer_n = normalize(prompt), normalize(answer)
+
+        digest = _hash64(prompt_n + "\x00" + answer_n)
+        first = self.exact.get(digest)
+        if first is not None:
+            return "exact", first
+
+        if self.near_on == "answer":
+            scope, text = _hash64(prompt_n), answer_n
+        else:
+            scope, text = 0, prompt_n + " " + answer_n
+
+        sig = self.hasher.signature(shingles(text, self.shingle_size))
+        if np is not None:
+            keys = ((sig.reshape(self.bands, self.rows) * self._np_multipliers).sum(axis=1)
+                    + np.uint64(scope) + self._np_bands).tolist()
+        else:
+            rows, mult = self.rows, self.multipliers
+            keys = [(sum(map(int.__mul__, sig[band * rows:(band + 1) * rows], mult)) + scope + band) & _MASK64
+                    for band in range(self.bands)]
+        for key in keys:
+            first = self.lsh.get(key)
+            if first is not None:
+                return "near", first
+
+        if not self.max_index or self.indexed < self.max_index:
+            self.indexed += 1
+            self.exact.add(digest, line_no)
+            for key in keys:
+                self.lsh.add(key, line_no)
+        return None
+
+
+def dedup_jsonl(in_path: str, out_path: str, report_path: str | None = None, **kwargs) -> dict:
+    dd = Deduplicator(**kwargs)
+    stats = {"records": 0, "kept": 0, "exact": 0, "near": 0, "unchecked": 0}
+    clusters = set()
+    loads = get_loads()
+    errors = get_decode_errors() + (ValueError,)
+
+    t0 = time.perf_counter()
+    with open(in_path, "r", encoding="utf-8") as fin, open(out_path, "w", encoding="utf-8") as fout:
+        frep = open(report_path, "w", encoding="utf-8") if report_path else None
+        try:
+            for line_no, line in enumerate(fin, 1):
+                if not line.strip():
+                    continue
+                stats["records"] += 1
+                try:
+                    dup = dd.check(line_no, loads(line))
+                except errors:
+                    # malformed, or no known schema: nothing to compare it with
+                    stats["unchecked"] += 1
+                    fout.write(line if line.endswith("\n") else line + "\n")
+                    continue
+                if dup is None:
+                    stats["kept"] += 1
+                    fout.write(line if line.endswith("\n") else line + "\n")
+                    continue
+
+                kind, first = dup
+                stats[kind] += 1
+                clusters.add(first)
+                if frep is not None:
+                    # one line per dropped record; duplicate_of is the cluster id
+                    frep.write(json.dumps({"line": line_no, "duplicate_of": first, "kind": kind}) + "\n")
+        finally:
+            if frep is not None:
+                frep.close()
+
+    stats["clusters"] = len(clusters)
+    stats["seconds"] = round(time.perf_counter() - t0, 3)
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("in_path")
+    parser.add_argument("out_path")
+    parser.add_argument("--report")
+    parser.add_argument("--near-on", choices=["answer", "sequence"], default="answer")
+    parser.add_argument("--num-perm", type=int, default=64)
+    parser.add_argument("--bands", type=int, default=8)
+    parser.add_argument("--shingle-size", type=int, default=3)
+    parser.add_argument("--max-index", type=int, default=MAX_INDEX, help="records indexed, 0: no cap")
+    args = parser.parse_args()
+
+    stats = dedup_jsonl(args.in_path, args.out_path, args.report, num_perm=args.num_perm, bands=args.bands,
+                        near_on=args.near_on, shingle_size=args.shingle_size, max_index=args.max_index)
+    print(json.dumps(stats))
+
+
+if __name__ == "__main__":
+    main()
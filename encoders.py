@@ -0,0 +1,170 @@
+"""
+Tokenizer registry.
+
+Backends are loaded lazily on first use and kept in a process-wide cache, so
+get_token_encoder() itself is free. The gpt2 fast tokenizer is serialized to
+CACHE_DIR/gpt2/tokenizer.json after the first load; later cold starts read it
+with the lightweight `tokenizers` package instead of importing `transformers`.
+tiktoken keeps its BPE table under CACHE_DIR/tiktoken. Once both files exist
+everything works offline.
+
+With WORDACY_TOKEN_SERVICE=<socket path | host:port> set, get_token_encoder()
+and get_batch_token_encoder() send their texts to a running token_service.py
+instead of loading a tokenizer in this process.
+
+    python encoders.py gpt2 tiktoken    # import / load / first-encode latency
+"""
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, List
+
+CACHE_DIR = Path(os.environ.get("WORDACY_TOKENIZER_CACHE", Path.home() / ".cache" / "wordacy-tokenizers"))
+
+
+class TokenizerBackend:
+
+    def __init__(self, name: str, encode: Callable[[str], List[int]],
+                 encode_batch: Callable[[List[str]], List[List[int]]], vocab_size: int,
+                 decode: Callable[[List[int]], str] | None = None):
+        self.name = name
+        self.encode = encode
+        self.encode_batch = encode_batch
+        self.vocab_size = vocab_size
+        self.decode = decode
+        # filled in by get_backend()
+        self.source = ""
+        self.import_s = 0.0
+        self.load_s = 0.0
+        self.first_encode_s = None
+
+
+# --------- loaders ---------
+
+def _load_gpt2(backend_name: str) -> TokenizerBackend:
+    path = CACHE_DIR / "gpt2" / "tokenizer.json"
+
+    if path.exists():
+        t0 = time.perf_counter()
+        from tokenizers import Tokenizer
+        t1 = time.perf_counter()
+        tok = Tokenizer.from_file(str(path))
+        backend = TokenizerBackend(
+            backend_name,
+            lambda s: tok.encode(s).ids,
+            lambda texts: [e.ids for e in tok.encode_batch(texts)] if texts else [],
+            tok.get_vocab_size(),
+            tok.decode,
+        )
+        backend.source = str(path)
+    else:
+        t0 = time.perf_counter()
+        from transformers import GPT2TokenizerFast
+        t1 = time.perf_counter()
+        offline = os.environ.get("HF_HUB_OFFLINE") == "1"
+        tok = GPT2TokenizerFast.from_pretrained("gpt2", local_files_only=offline)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tok.backend_tokenizer.save(str(path))
+        except OSError:
+            pass  # read-only cache dir: keep working, just without the fast path
+        backend = TokenizerBackend(
+            backend_name,
+            tok.encode,
+            lambda texts: tok(texts)["input_ids"] if texts else [],
+            tok.vocab_size,
+            # no clean_up_tokenization_spaces: decode must round-trip for truncation
+            lambda ids: tok.decode(ids, clean_up_tokenization_spaces=False),
+        )
+        backend.source = "transformers"
+
+    backend.import_s = t1 - t0
+    backend.load_s = time.perf_counter() - t1
+    return backend
+
+
+def _load_tiktoken(backend_name: str) -> TokenizerBackend:
+    encoding = backend_name.partition(":")[2] or "gpt2"
+    cache = CACHE_DIR / "tiktoken"
+    try:
+        cache.mkdir(parents=True, exist_ok=True)
+        os.environ.setdefault("TIKTOKEN_CACHE_DIR", str(cache))
+    except OSError:
+        pass  # read-only cache dir: tiktoken falls back to its own default
+
+    t0 = time.perf_counter()
+    import tiktoken
+    t1 = time.perf_counter()
+    enc = tiktoken.get_encoding(encoding)
+
+    backend = TokenizerBackend(backend_name, enc.encode, enc.encode_batch, enc.n_vocab, enc.decode)
+    backend.source = os.environ.get("TIKTOKEN_CACHE_DIR", "tiktoken")
+    backend.import_s = t1 - t0
+    backend.load_s = time.perf_counter() - t1
+    return backend
+
+
+LOADERS: Dict[str, Callable[[str], TokenizerBackend]] = {
+    "gpt2": _load_gpt2,
+    "tiktoken": _load_tiktoken,
+}
+
+_backends: Dict[str, TokenizerBackend] = {}
+
+
+def normalize_name(tokenizer: str | None) -> str:
+    # "gpt2" -> transformers/tokenizers; "tiktoken:<encoding>" -> that encoding;
+    # anything else falls back to tiktoken gpt2, as before
+    tokenizer = (tokenizer or "gpt2").lower()
+    if tokenizer == "gpt2" or tokenizer.startswith("tiktoken:"):
+        return tokenizer
+    return "tiktoken"
+
+
+def get_backend(tokenizer: str | None = None) -> TokenizerBackend:
+    name = normalize_name(tokenizer)
+    backend = _backends.get(name)
+    if backend is None:
+        backend = LOADERS[name.partition(":")[0]](name)
+
+        t0 = time.perf_counter()
+        backend.encode("warm up")
+        backend.first_encode_s = time.perf_counter() - t0
+
+        _backends[name] = backend
+    return backend
+
+
+def loaded_backends() -> Dict[str, TokenizerBackend]:
+    return dict(_backends)
+
+
+# --------- encoders ---------
+
+def get_token_encoder(tokenizer: str | None = None):
+    # nothing is imported until the first call
+    name = normalize_name(tokenizer)
+    if os.environ.get("WORDACY_TOKEN_SERVICE"):
+        from token_service import get_service_token_encoder
+        return get_service_token_encoder(name, os.environ["WORDACY_TOKEN_SERVICE"])
+    return lambda s: len(get_backend(name).encode(s))
+
+
+def get_batch_token_encoder(tokenizer: str | None = None):
+    """
+    Same backends as get_token_encoder(), but the returned callable takes a list
+    of strings and returns a list of token counts, using one batch call per list.
+    """
+    name = normalize_name(tokenizer)
+    if os.environ.get("WORDACY_TOKEN_SERVICE"):
+        from token_service import get_service_batch_token_encoder
+        return get_service_batch_token_encoder(name, os.environ["WORDACY_TOKEN_SERVICE"])
+    return lambda texts: [len(ids) for ids in get_backend(name).encode_batch(texts)]
+
+
+if __name__ == "__main__":
+    for name in sys.argv[1:] or ["gpt2", "tiktoken"]:
+        b = get_backend(name)
+        print(f"{b.name:<20} import = {b.import_s * 1000:8.1f} ms, load = {b.load_s * 1000:8.1f} ms, "
+              f"first encode = {b.first_encode_s * 1000:6.2f} ms  ({b.source})")
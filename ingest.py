@@ -0,0 +1,251 @@
+"""
+Async ingestion of many JSONL / text sources with bounded queues.
+
+    sources (files, http://, https://)  --line batches-->  raw queue
+    raw queue  --decode in an executor-->                   record queue
+    record queue  --token counting in a thread-->           jsonl_stats histogram
+
+Every source is read by its own task (at most --concurrency at a time) in
+byte blocks, split into batches of --batch-lines lines and put on the raw
+queue. Queues are bounded, so a slow tokenizer stops the readers instead of
+buffering whole files: peak memory is about (raw + record queue size +
+in-flight batches) * batch size. Files whose name ends in .txt are converted
+with txt_convert.convert_line() (lines without " is " are counted as rejects),
+everything else is decoded as JSONL. Lines that are not valid UTF-8, malformed
+JSON and records of no known schema are counted as invalid and skipped.
+
+Readers, decoders and the tokenizer run in one TaskGroup: if any of them
+fails, the others are cancelled and run() raises an ExceptionGroup holding
+the error(s), instead of the rest of the pipeline blocking on a full queue.
+
+HTTP uses a minimal HTTP/1.0 GET over asyncio streams (stdlib only, no
+redirects or chunked encoding), which is enough for a local file server or
+presigned object-store URLs:
+
+    python -m http.server 8000 &
+    python ingest.py http://localhost:8000/wordacy-train.jsonl verbs_sft.jsonl text-1.txt
+"""
+import argparse
+import asyncio
+import json
+import os
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import AsyncIterator, Dict, List, Tuple
+from urllib.parse import urlsplit
+
+from encoders import get_batch_token_encoder
+from jsonl_reader import get_decode_errors, get_loads
+from jsonl_stats import SEQUENCE, LengthHistogram, build_sequence, detect_schema
+from txt_convert import convert_line
+
+BLOCK_BYTES = 1 << 20
+_DONE = None
+
+
+# --------- sources ---------
+
+async def read_file(path: str, block_bytes: int = BLOCK_BYTES) -> AsyncIterator[bytes]:
+    loop = asyncio.get_running_loop()
+    f = await loop.run_in_executor(None, open, path, "rb")
+    try:
+        while True:
+            block = await loop.run_in_executor(None, f.read, block_bytes)
+            if not block:
+                return
+            yield block
+    finally:
+        f.close()
+
+
+async def read_http(url: str, block_bytes: int = BLOCK_BYTES) -> AsyncIterator[bytes]:
+    parts = urlsplit(url)
+    https = parts.scheme == "https"
+    port = parts.port or (443 if https else 80)
+    reader, writer = await asyncio.open_connection(parts.hostname, port, ssl=https or None)
+    try:
+        path = parts.path or "/"
+        if parts.query:
+            path += "?" + parts.query
+        writer.write(f"GET {path} HTTP/1.0\r\nHost: {parts.netloc}\r\nConnection: close\r\n\r\n".encode("latin-1"))
+        await writer.drain()
+
+        status = await reader.readline()
+        if b" 200 " not in status:
+            raise IOError(f"{url}: {status.decode('latin-1').strip()}")
+        while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+            pass
+
+        while True:
+            block = await reader.read(block_bytes)
+            if not block:
+                return
+            yield block
+    finally:
+        writer.close()
+
+
+def open_source(source: str, block_bytes: int = BLOCK_BYTES) -> AsyncIterator[bytes]:
+    if source.startswith(("http://", "https://")):
+        return read_http(source, block_bytes)
+    return read_file(source, block_bytes)
+
+
+def source_kind(source: str) -> str:
+    return "txt" if urlsplit(source).path.endswith(".txt") else "jsonl"
+
+
+# --------- decode (runs in the executor) ---------
+
+def decode_lines(kind: str, lines: List[bytes]) -> Tuple[List[dict], int, int]:
+    records = []
+    rejects = invalid = 0
+    loads = get_loads()
+    errors = get_decode_errors()
+    for raw in lines:
+        line = raw.strip()
+        if not line:
+            continue
+        if kind == "txt":
+            try:
+                text = line.decode("utf-8")
+            except UnicodeDecodeError:
+                invalid += 1
+                continue
+            rec = convert_line(text)
+            if rec is None:
+                rejects += 1
+                continue
+        else:
+            try:
+                rec = loads(line)
+                if not isinstance(rec, dict):
+                    raise ValueError("not a JSON object")
+                detect_schema(rec)
+            except errors + (ValueError,):
+                # malformed JSON, not an object, or no known schema
+                invalid += 1
+                continue
+        records.append(rec)
+    return records, rejects, invalid
+
+
+# --------- pipeline ---------
+
+class Ingestor:
+
+    def __init__(self, tokenizer: str | None = None, concurrency: int = 8, queue_size: int = 16,
+                 batch_lines: int = 1024, decode_workers: int = 0, block_bytes: int = BLOCK_BYTES):
+        self.tokenizer = tokenizer
+        self.concurrency = concurrency
+        self.queue_size = queue_size
+        self.batch_lines = batch_lines
+        self.decode_workers = decode_workers
+        self.block_bytes = block_bytes
+
+        self.hist = LengthHistogram()
+        self.stats: Dict[str, int] = {"bytes": 0, "lines": 0, "records": 0, "rejected": 0, "invalid": 0,
+                                      "max_raw_queue": 0, "max_record_queue": 0}
+        self.source_bytes: Dict[str, int] = {}
+
+    async def _read_source(self, source: str, raw_q: asyncio.Queue, gate: asyncio.Semaphore) -> None:
+        kind = source_kind(source)
+        async with gate:
+            carry = b""
+            batch: List[bytes] = []
+            async for block in open_source(source, self.block_bytes):
+                self.stats["bytes"] += len(block)
+                self.source_bytes[source] = self.source_bytes.get(source, 0) + len(block)
+                lines = (carry + block).split(b"\n")
+                carry = lines.pop()
+                batch.extend(lines)
+                while len(batch) >= self.batch_lines:
+                    await raw_q.put((kind, batch[:self.batch_lines]))
+                    del batch[:self.batch_lines]
+                    self.stats["max_raw_queue"] = max(self.stats["max_raw_queue"], raw_q.qsize())
+            if carry:
+                batch.append(carry)
+            if batch:
+                await raw_q.put((kind, batch))
+
+    async def _decode(self, raw_q: asyncio.Queue, rec_q: asyncio.Queue, executor: Executor) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            item = await raw_q.get()
+            if item is _DONE:
+                return
+            kind, lines = item
+            records, rejects, invalid = await loop.run_in_executor(executor, decode_lines, kind, lines)
+            self.stats["lines"] += len(lines)
+            self.stats["rejected"] += rejects
+            self.stats["invalid"] += invalid
+            await rec_q.put(records)
+            self.stats["max_record_queue"] = max(self.stats["max_record_queue"], rec_q.qsize())
+
+    async def _tokenize(self, rec_q: asyncio.Queue) -> None:
+        loop = asyncio.get_running_loop()
+        encode_batch = get_batch_token_encoder(self.tokenizer)
+        while True:
+            records = await rec_q.get()
+            if records is _DONE:
+                return
+            texts = [build_sequence(obj, detect_schema(obj)) for obj in records]
+            # tokenizer backends release the GIL, so a thread keeps the loop responsive
+            for n in await loop.run_in_executor(None, encode_batch, texts):
+                self.hist.add(n)
+            self.stats["records"] += len(records)
+
+    async def run(self, sources: List[str]) -> dict:
+        raw_q: asyncio.Queue = asyncio.Queue(self.queue_size)
+        rec_q: asyncio.Queue = asyncio.Queue(self.queue_size)
+        gate = asyncio.Semaphore(self.concurrency)
+        n_decoders = max(self.decode_workers, 1)
+
+        if self.decode_workers > 0:
+            executor: Executor = ProcessPoolExecutor(self.decode_workers)
+        else:
+            executor = ThreadPoolExecutor(1)
+
+        t0 = time.perf_counter()
+        try:
+            # the first failing task cancels every other one (and this body)
+            async with asyncio.TaskGroup() as tg:
+                readers = [tg.create_task(self._read_source(s, raw_q, gate)) for s in sources]
+                decoders = [tg.create_task(self._decode(raw_q, rec_q, executor)) for _ in range(n_decoders)]
+                tg.create_task(self._tokenize(rec_q))
+
+                await asyncio.gather(*readers)
+                for _ in decoders:
+                    await raw_q.put(_DONE)
+                await asyncio.gather(*decoders)
+                await rec_q.put(_DONE)
+        finally:
+            executor.shutdown(cancel_futures=True)
+
+        dt = time.perf_counter() - t0
+        report = dict(self.stats)
+        report["seconds"] = round(dt, 3)
+        report["mb_per_s"] = round(report["bytes"] / (1 << 20) / dt, 2) if dt > 0 else 0.0
+        report["records_per_s"] = round(report["records"] / dt) if dt > 0 else 0
+        report[SEQUENCE] = self.hist.to_dict()
+        return report
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("sources", nargs="+", help="files or http(s) URLs")
+    parser.add_argument("--tokenizer", default="gpt2")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--queue-size", type=int, default=16)
+    parser.add_argument("--batch-lines", type=int, default=1024)
+    parser.add_argument("--decode-workers", type=int, default=0, help="0: decode in one thread")
+    args = parser.parse_args()
+
+    ingestor = Ingestor(args.tokenizer, args.concurrency, args.queue_size, args.batch_lines,
+                        min(args.decode_workers, os.cpu_count() or 1))
+    report = asyncio.run(ingestor.run(args.sources))
+    print(json.dumps(report))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+"""
+Compiled JSONL record templates, shared by generate.py and augment.py.
+
+A record template is a dict of field -> str.format template. Compiled, it is
+one format string that renders the whole JSONL line: format_map() it with
+JSON-escaped values (json_escape) and the result is byte-identical to
+json.dumps(record, ensure_ascii=False) + "\\n". JSON string escaping works
+character by character, so escaping the template text once and each value
+once, then concatenating, gives the same bytes.
+"""
+from json.encoder import encode_basestring
+from string import Formatter
+from typing import Dict
+
+
+def json_escape(s: str) -> str:
+    return encode_basestring(s)[1:-1]
+
+
+def compile_template(tmpl: str) -> str:
+    # "Give me ... \"{v}\"." -> JSON-escaped literal text with the {fields} left in place
+    out = []
+    for literal, field, spec, conv in Formatter().parse(tmpl):
+        out.append(json_escape(literal).replace("{", "{{").replace("}", "}}"))
+        if field is not None:
+            if spec or conv:
+                raise ValueError(f"format specs are not supported in templates: {tmpl!r}")
+            out.append("{" + field + "}")
+    return "".join(out)
+
+
+def compile_record_template(fields: Dict[str, str]) -> str:
+    """
+    Format string for one JSONL line {"<key>": "<template>", ...}, same bytes as
+    json.dumps(..., ensure_ascii=False) once format_map()-ed with JSON-escaped values.
+    """
+    return "{{" + ", ".join(
+        '"' + json_escape(k).replace("{", "{{").replace("}", "}}") + '": "' + compile_template(v) + '"'
+        for k, v in fields.items()
+    ) + "}}\n"
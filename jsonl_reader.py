@@ -0,0 +1,146 @@
+"""
+Pluggable JSONL reading for the data scripts.
+
+The decoder is picked once, at import: msgspec if installed, else orjson, else
+the stdlib json module. WORDACY_JSON=msgspec|orjson|json (or set_backend())
+forces one. Files are read in large binary blocks and split on b"\\n"; lines are
+handed to the decoder as bytes, which every backend accepts without a str copy.
+
+get_field_decoder(fields) returns a decoder for callers that only need a few
+fields: it yields a tuple of their values (None when missing). With msgspec
+this decodes into a typed struct and skips every other field without building
+it; the other backends decode the full object and pick the fields out.
+
+    for definition, example in iter_jsonl("wordacy-train.jsonl", ("definition", "example")):
+        ...
+"""
+import json
+import json.scanner
+import os
+from functools import lru_cache
+from typing import Callable, Iterator, Sequence, Tuple
+
+BLOCK_BYTES = 4 << 20
+BACKENDS = ("msgspec", "orjson", "json")
+
+BACKEND = "json"
+
+
+def _available(name: str) -> bool:
+    try:
+        __import__(name)
+    except ImportError:
+        return False
+    return True
+
+
+def set_backend(name: str | None = None) -> str:
+    """
+    Selects the decoder backend (None: the fastest one installed) and returns its
+    name. Decoders already handed out keep the backend they were built with.
+    """
+    global BACKEND
+    if name is None:
+        name = next(b for b in BACKENDS if b == "json" or _available(b))
+    elif name not in BACKENDS:
+        raise ValueError(f"unknown JSON backend: {name}")
+    elif not _available(name):
+        raise ImportError(f"JSON backend {name} is not installed")
+    BACKEND = name
+    _field_decoder.cache_clear()
+    return name
+
+
+_json_decoder = json.JSONDecoder()
+_json_decode = _json_decoder.decode
+_json_scan = json.scanner.make_scanner(_json_decoder)
+
+
+def _json_loads(line: bytes | str):
+    # json.loads() on bytes goes through encoding detection, and decode() wraps the
+    # C scanner in a whitespace regex and two Python frames; lines are stripped, so
+    # call the scanner directly and leave padded or malformed input to decode()
+    if not isinstance(line, str):
+        line = line.decode("utf-8")
+    try:
+        obj, end = _json_scan(line, 0)
+    except StopIteration:
+        return _json_decode(line)
+    if end != len(line):
+        return _json_decode(line)
+    return obj
+
+
+def get_loads() -> Callable[[bytes | str], object]:
+    if BACKEND == "msgspec":
+        import msgspec
+        return msgspec.json.Decoder().decode
+    if BACKEND == "orjson":
+        import orjson
+        return orjson.loads
+    return _json_loads
+
+
+def get_decode_errors() -> Tuple[type, ...]:
+    # what get_loads() raises on a malformed line
+    if BACKEND == "msgspec":
+        import msgspec
+        return (msgspec.DecodeError,)
+    # json.JSONDecodeError, orjson.JSONDecodeError and UnicodeDecodeError are all ValueErrors
+    return (ValueError,)
+
+
+@lru_cache(maxsize=None)
+def _field_decoder(backend: str, fields: Tuple[str, ...]) -> Callable[[bytes | str], tuple]:
+    if backend == "msgspec":
+        import msgspec
+        Record = msgspec.defstruct("Record", [(f, str | None, None) for f in fields])
+        decode = msgspec.json.Decoder(Record).decode
+        loads = msgspec.json.Decoder().decode
+        astuple = msgspec.structs.astuple
+
+        def decode_fields(line):
+            try:
+                return astuple(decode(line))
+            except msgspec.ValidationError:
+                # a field that is not a string (or null): fall back to untyped
+                return tuple(map(loads(line).get, fields))
+        return decode_fields
+
+    loads = get_loads()
+    return lambda line: tuple(map(loads(line).get, fields))
+
+
+def get_field_decoder(fields: Sequence[str]) -> Callable[[bytes | str], tuple]:
+    return _field_decoder(BACKEND, tuple(fields))
+
+
+def iter_lines(path: str, block_bytes: int = BLOCK_BYTES) -> Iterator[bytes]:
+    # stripped, non-empty lines (bytes); the last line may lack its newline
+    with open(path, "rb") as f:
+        carry = b""
+        while True:
+            block = f.read(block_bytes)
+            if not block:
+                break
+            lines = (carry + block).split(b"\n")
+            carry = lines.pop()
+            for line in lines:
+                line = line.strip()
+                if line:
+                    yield line
+        carry = carry.strip()
+        if carry:
+            yield carry
+
+
+def iter_jsonl(path: str, fields: Sequence[str] | None = None, block_bytes: int = BLOCK_BYTES) -> Iterator:
+    """
+    Yields every record as a dict, or as a tuple of `fields` values when given.
+    """
+    decode = get_loads() if fields is None else get_field_decoder(fields)
+    for line in iter_lines(path, block_bytes):
+        yield decode(line)
+
+
+set_backend(os.environ.get("WORDACY_JSON") or None)
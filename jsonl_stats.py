@@ -0,0 +1,181 @@
+"""
+Single-pass, schema-aware token statistics for JSONL datasets.
+
+The schema is detected per record (files like wordacy-train.jsonl mix several)
+or forced with --schema. Every field of a schema is counted separately, plus
+the full sequence the model sees. Lengths go into integer histograms, so memory
+is bounded by the longest record, not by the number of records, and
+percentiles are exact.
+
+    python jsonl_stats.py wordacy-train.jsonl --max-seq-len 32 64 128
+"""
+import argparse
+import json
+from typing import Dict, Iterator, List, Tuple
+
+from encoders import get_batch_token_encoder
+from jsonl_reader import iter_jsonl
+from token_count import iter_chunks
+
+# schema name -> (fields, fields joined into the full sequence, separator)
+SCHEMAS: Dict[str, Tuple[Tuple[str, ...], Tuple[str, ...], str]] = {
+    "qa": (("context", "question", "answer"), ("context", "question", "example", "answer"), "\n"),
+    "definition": (("verb", "definition", "example"), ("definition", "example"), ": "),  # main.main()
+    "meaning": (("verb", "meaning", "example"), ("meaning", "example"), "\n"),          # txt_to_jsonl()
+}
+
+SEQUENCE = "sequence"
+
+
+_detected: Dict[Tuple[str, ...], str] = {}
+
+
+def detect_schema(obj: dict) -> str:
+    key = tuple(obj)
+    schema = _detected.get(key)
+    if schema is None:
+        schema = _detected[key] = _detect_schema(obj)
+    return schema
+
+
+def _detect_schema(obj: dict) -> str:
+    best, best_hits = None, 0
+    for name, (fields, _, _) in SCHEMAS.items():
+        hits = sum(1 for k in fields if k in obj)
+        if hits > best_hits:
+            best, best_hits = name, hits
+    if best is None:
+        raise ValueError(f"unknown JSONL schema, keys = {sorted(obj)}")
+    return best
+
+
+def build_sequence(obj: dict, schema: str) -> str:
+    _, seq_fields, sep = SCHEMAS[schema]
+    return sep.join(v for v in (obj.get(k) or "" for k in seq_fields) if v)
+
+
+class LengthHistogram:
+
+    def __init__(self):
+        self.freq: Dict[int, int] = {}
+        self.items = 0
+        self.total = 0
+        self.max = 0
+
+    def add(self, n: int) -> None:
+        self.freq[n] = self.freq.get(n, 0) + 1
+        self.items += 1
+        self.total += n
+        if n > self.max:
+            self.max = n
+
+    def merge(self, other: "LengthHistogram") -> None:
+        for n, c in other.freq.items():
+            self.freq[n] = self.freq.get(n, 0) + c
+        self.items += other.items
+        self.total += other.total
+        self.max = max(self.max, other.max)
+
+    def percentile(self, q: float) -> int:
+        # nearest-rank percentile
+        if not self.items:
+            return 0
+        rank = max(1, -(-self.items * q // 100))
+        seen = 0
+        for n in sorted(self.freq):
+            seen += self.freq[n]
+            if seen >= rank:
+                return n
+        return self.max
+
+    def over(self, limit: int) -> int:
+        return sum(c for n, c in self.freq.items() if n > limit)
+
+    def buckets(self) -> Dict[int, int]:
+        # power-of-two upper bounds, handy for batch bucketing
+        out: Dict[int, int] = {}
+        for n, c in self.freq.items():
+            b = 1
+            while b < n:
+                b <<= 1
+            out[b] = out.get(b, 0) + c
+        return dict(sorted(out.items()))
+
+    def to_dict(self, limits: List[int] = ()) -> dict:
+        return {
+            "items": self.items,
+            "tokens": self.total,
+            "mean": round(self.total / self.items, 2) if self.items else 0,
+            "p50": self.percentile(50),
+            "p95": self.percentile(95),
+            "p99": self.percentile(99),
+            "max": self.max,
+            "over": {str(n): self.over(n) for n in limits},
+        }
+
+
+def iter_records(path: str) -> Iterator[dict]:
+    return iter_jsonl(path)
+
+
+def compute_stats(path: str, tokenizer: str | None = None, schema: str | None = None,
+                  chunk_size: int = 1024) -> Dict[str, Dict[str, LengthHistogram]]:
+    """
+    Returns {schema: {field: histogram}}; every schema also gets a "sequence"
+    histogram for the full prompt+answer text.
+    """
+    encode_batch = get_batch_token_encoder(tokenizer)
+    stats: Dict[str, Dict[str, LengthHistogram]] = {}
+
+    for chunk in iter_chunks(iter_records(path), chunk_size):
+        texts: List[str] = []
+        targets: List[LengthHistogram] = []
+
+        for obj in chunk:
+            name = schema or detect_schema(obj)
+            fields = SCHEMAS[name][0]
+            hists = stats.get(name)
+            if hists is None:
+                hists = stats[name] = {k: LengthHistogram() for k in fields + (SEQUENCE,)}
+
+            for k in fields:
+                texts.append(obj.get(k) or "")
+                targets.append(hists[k])
+            texts.append(build_sequence(obj, name))
+            targets.append(hists[SEQUENCE])
+
+        # one batch call per chunk
+        for h, n in zip(targets, encode_batch(texts)):
+            h.add(n)
+
+    return stats
+
+
+def print_report(path: str, stats: Dict[str, Dict[str, LengthHistogram]], limits: List[int] = ()) -> None:
+    overall = LengthHistogram()
+    for schema, hists in stats.items():
+        print(f"{path}: schema = {schema}")
+        for name, h in hists.items():
+            print(f"  {name:<10} {json.dumps(h.to_dict(limits))}")
+        overall.merge(hists[SEQUENCE])
+
+    print(f"{path}: all sequences")
+    print(f"  {SEQUENCE:<10} {json.dumps(overall.to_dict(limits))}")
+    print(f"  buckets    {json.dumps(overall.buckets())}")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("paths", nargs="+")
+    parser.add_argument("--tokenizer", default="gpt2")
+    parser.add_argument("--schema", choices=sorted(SCHEMAS))
+    parser.add_argument("--max-seq-len", type=int, nargs="*", default=[64, 128, 256])
+    args = parser.parse_args()
+
+    for path in args.paths:
+        stats = compute_stats(path, args.tokenizer, args.schema)
+        print_report(path, stats, args.max_seq_len)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,219 @@
+"""
+Single-pass length filter / truncation against several tokenizers at once.
+
+    python length_filter.py wordacy-train.jsonl wordacy-train.filtered.jsonl \\
+        --rejects wordacy-train.rejects.jsonl --tokenizers gpt2 tiktoken:cl100k_base \\
+        --budget answer=48 example=64 question=32:reject --max-seq-len 128
+
+Records are read and parsed once, in chunks. For every chunk each tokenizer
+runs one encode_batch over the budgeted fields and the full sequence
+(jsonl_stats.build_sequence), so an extra tokenizer costs only its encode
+time. A record must fit every tokenizer:
+
+    field=N           the field is cut to at most N tokens (other fields are kept intact)
+    field=N:reject    the record is rejected if the field is over N tokens
+    --max-seq-len N   the record is rejected if the full sequence is over N tokens
+
+Truncation is done on the text, so the output stays tokenizer agnostic: each
+tokenizer decodes its first N ids, the shortest of these prefixes wins, and
+truncated records are re-encoded with every tokenizer to confirm they now fit
+(including --max-seq-len). Kept records are written byte for byte as read;
+truncated ones are re-serialized. Every rejected record gets a line in the
+rejection log: {"record": n, "reason": field | "sequence", "tokenizer": ...,
+"tokens": ..., "limit": ...}, n counting non-empty lines from 1.
+"""
+import argparse
+import json
+import os
+import time
+from typing import Dict, List, Sequence, Tuple
+
+from encoders import TokenizerBackend, get_backend
+from jsonl_reader import get_loads, iter_lines
+from jsonl_stats import build_sequence, detect_schema
+from token_count import iter_chunks
+
+SEQUENCE = "sequence"
+ACTIONS = ("truncate", "reject")
+
+
+def parse_budgets(specs: Sequence[str]) -> Dict[str, Tuple[int, str]]:
+    # ["answer=48", "question=32:reject"] -> {"answer": (48, "truncate"), "question": (32, "reject")}
+    budgets = {}
+    for spec in specs:
+        field, sep, rest = spec.partition("=")
+        limit, _, action = rest.partition(":")
+        action = action or "truncate"
+        if not sep or not field or not limit.isdigit() or action not in ACTIONS:
+            raise ValueError(f"bad budget {spec!r}, expected field=N or field=N:reject")
+        budgets[field] = (int(limit), action)
+    return budgets
+
+
+def truncate_text(text: str, ids: List[int], limit: int, decode) -> str:
+    # decode(ids[:limit]) is a prefix of text, up to a split multi-byte character at the end;
+    # keep the part it has in common with text, found in one pass
+    prefix = decode(ids[:limit])
+    if text.startswith(prefix):
+        return prefix
+    return os.path.commonprefix([text, prefix])
+
+
+class LengthFilter:
+
+    def __init__(self, tokenizers: Sequence[str], budgets: Dict[str, Tuple[int, str]],
+                 max_seq_len: int = 0, schema: str | None = None):
+        self.backends: List[TokenizerBackend] = [get_backend(t) for t in tokenizers]
+        for b in self.backends:
+            if b.decode is None and any(action == "truncate" for _, action in budgets.values()):
+                raise ValueError(f"tokenizer {b.name} cannot decode, so it cannot truncate")
+        self.budgets = budgets
+        self.fields = list(budgets)
+        self.max_seq_len = max_seq_len
+        self.schema = schema
+        self.stats = {
+            "records": 0, "kept": 0, "truncated": 0, "rejected": 0,
+            "reasons": {},
+            "encode_s": {b.name: 0.0 for b in self.backends},
+        }
+
+    def _texts(self, obj: dict) -> List[str]:
+        texts = [obj.get(f) or "" for f in self.fields]
+        if self.max_seq_len:
+            texts.append(build_sequence(obj, self.schema or detect_schema(obj)))
+        return texts
+
+    def _encode(self, texts: List[str]) -> List[List[List[int]]]:
+        # [backend][text] -> ids; the only per-tokenizer work
+        out = []
+        for b in self.backends:
+            t0 = time.perf_counter()
+            out.append(b.encode_batch(texts))
+            self.stats["encode_s"][b.name] += time.perf_counter() - t0
+        return out
+
+    def _over(self, ids: List[List[List[int]]], base: int, actions: Sequence[str]) -> dict | None:
+        # first limit a record breaks, checking only the given actions
+        for b, per_text in zip(self.backends, ids):
+            for k, field in enumerate(self.fields):
+                limit, action = self.budgets[field]
+                n = len(per_text[base + k])
+                if action in actions and n > limit:
+                    return {"reason": field, "tokenizer": b.name, "tokens": n, "limit": limit}
+            if self.max_seq_len:
+                n = len(per_text[base + len(self.fields)])
+                if n > self.max_seq_len:
+                    return {"reason": SEQUENCE, "tokenizer": b.name, "tokens": n, "limit": self.max_seq_len}
+        return None
+
+    def process(self, chunk: List[Tuple[int, bytes, dict]]) -> Tuple[List[bytes], List[dict]]:
+        """
+        chunk: (record number, raw line, parsed record). Returns the output
+        lines (in input order) and the rejection log entries.
+        """
+        width = len(self.fields) + (1 if self.max_seq_len else 0)
+        ids = self._encode([t for _, _, obj in chunk for t in self._texts(obj)])
+
+        results: List[bytes | dict | None] = []
+        retry: List[Tuple[int, int, dict]] = []
+        for i, (rec_no, line, obj) in enumerate(chunk):
+            base = i * width
+            rejected = self._over(ids, base, ("reject",))
+            if rejected is not None:
+                results.append(dict(rejected, record=rec_no))
+                continue
+
+            cut = {}
+            for k, field in enumerate(self.fields):
+                limit, action = self.budgets[field]
+                text = obj.get(field)
+                if action != "truncate" or not text:
+                    continue
+                shortest = text
+                for b, per_text in zip(self.backends, ids):
+                    if len(per_text[base + k]) > limit:
+                        prefix = truncate_text(text, per_text[base + k], limit, b.decode)
+                        if len(prefix) < len(shortest):
+                            shortest = prefix
+                if shortest is not text:
+                    cut[field] = shortest
+
+            if cut:
+                results.append(None)
+                retry.append((i, rec_no, dict(obj, **cut)))
+                continue
+
+            over = self._over(ids, base, ())
+            results.append(line if over is None else dict(over, record=rec_no))
+
+        if retry:
+            # truncated records must fit every tokenizer, sequence included
+            ids = self._encode([t for _, _, obj in retry for t in self._texts(obj)])
+            for j, (i, rec_no, obj) in enumerate(retry):
+                over = self._over(ids, j * width, ACTIONS)
+                if over is None:
+                    self.stats["truncated"] += 1
+                    results[i] = json.dumps(obj, ensure_ascii=False).encode("utf-8")
+                else:
+                    results[i] = dict(over, record=rec_no)
+
+        out, rejects = [], []
+        for r in results:
+            if isinstance(r, dict):
+                rejects.append(r)
+                self.stats["reasons"][r["reason"]] = self.stats["reasons"].get(r["reason"], 0) + 1
+            else:
+                out.append(r)
+        self.stats["records"] += len(chunk)
+        self.stats["kept"] += len(out)
+        self.stats["rejected"] += len(rejects)
+        return out, rejects
+
+
+def filter_jsonl(in_path: str, out_path: str, reject_path: str | None, tokenizers: Sequence[str],
+                 budgets: Dict[str, Tuple[int, str]], max_seq_len: int = 0, schema: str | None = None,
+                 chunk_size: int = 1024) -> dict:
+    lf = LengthFilter(tokenizers, budgets, max_seq_len, schema)
+    loads = get_loads()
+
+    t0 = time.perf_counter()
+    records = ((n, line, loads(line)) for n, line in enumerate(iter_lines(in_path), 1))
+    with open(out_path, "wb") as fout:
+        frej = open(reject_path, "w", encoding="utf-8") if reject_path else None
+        try:
+            for chunk in iter_chunks(records, chunk_size):
+                out, rejects = lf.process(chunk)
+                if out:
+                    fout.write(b"\n".join(out) + b"\n")
+                if frej is not None:
+                    for r in rejects:
+                        frej.write(json.dumps(r) + "\n")
+        finally:
+            if frej is not None:
+                frej.close()
+
+    stats = lf.stats
+    stats["seconds"] = round(time.perf_counter() - t0, 3)
+    stats["encode_s"] = {k: round(v, 3) for k, v in stats["encode_s"].items()}
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("path")
+    parser.add_argument("out")
+    parser.add_argument("--rejects", help="rejection log (JSONL)")
+    parser.add_argument("--tokenizers", nargs="+", default=["gpt2"])
+    parser.add_argument("--budget", nargs="*", default=[], help="field=N (truncate) or field=N:reject")
+    parser.add_argument("--max-seq-len", type=int, default=0)
+    parser.add_argument("--schema", choices=("qa", "definition", "meaning"), help="default: detect per record")
+    parser.add_argument("--chunk-size", type=int, default=1024)
+    args = parser.parse_args()
+
+    stats = filter_jsonl(args.path, args.out, args.rejects, args.tokenizers, parse_budgets(args.budget),
+                         args.max_seq_len, args.schema, args.chunk_size)
+    print(json.dumps(stats))
+
+
+if __name__ == "__main__":
+    main()
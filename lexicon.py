@@ -0,0 +1,231 @@
+"""
+Compact, memory-mapped lexicon of verb forms.
+
+All distinct strings (lemmas and forms) are interned once, sorted by their
+utf-8 bytes and stored back to back in one buffer; a string id is its rank.
+A string is found through an open-addressing hash index (crc32, linear
+probing, at most half full), then everything else is flat uint32 arrays:
+
+    slots[crc32 & mask]      sid, or NONE for an empty slot
+    lemma_of[sid]            lemma index of a base form, or NONE
+    forms[lemma * 4 + slot]  sid of past / pp / s3 / ing, or NONE
+    rev_offsets[sid]         CSR index into rev_entries = lemma * 4 + slot,
+                             for form -> lemma lookups ("went" -> go/past)
+
+File layout (little endian): b"WLX1", uint32 n_strings, uint32 n_lemmas,
+uint32 n_rev, uint32 n_slots, then str_offsets[n_strings + 1], lemma_of[n_strings],
+lemma_sid[n_lemmas], forms[n_lemmas * 4], rev_offsets[n_strings + 1],
+rev_entries[n_rev], slots[n_slots] (all uint32) and the string buffer.
+
+Lexicon is a read-only Mapping base -> {"past", "pp", "s3", "ing"}, so it can
+be passed to generate.build_forms() / generate_jsonl() instead of IRREGULARS.
+
+    python lexicon.py build irregulars.lex             # from generate.IRREGULARS
+    python lexicon.py build lexicon.lex --tsv verbs.tsv  # base past pp s3 ing per line
+    python lexicon.py lookup irregulars.lex go went
+"""
+import argparse
+import mmap
+import struct
+import sys
+import zlib
+from array import array
+from collections.abc import Mapping
+from typing import Dict, Iterator, List, Tuple
+
+MAGIC = b"WLX1"
+_HEADER = struct.Struct("<4sIIII")
+FORMS = ("past", "pp", "s3", "ing")
+NONE = 0xFFFFFFFF
+
+
+def build_lexicon(table: Dict[str, Dict[str, str]], path: str) -> None:
+    strings = set(table)
+    for forms in table.values():
+        strings.update(v for k, v in forms.items() if k in FORMS)
+    encoded = sorted(s.encode("utf-8") for s in strings)
+    sid = {s.decode("utf-8"): i for i, s in enumerate(encoded)}
+
+    str_offsets = array("I", [0])
+    for s in encoded:
+        str_offsets.append(str_offsets[-1] + len(s))
+
+    lemmas = sorted(table, key=lambda b: sid[b])
+    lemma_of = array("I", [NONE]) * len(encoded)
+    lemma_sid = array("I")
+    forms = array("I")
+    reverse: List[List[int]] = [[] for _ in encoded]
+    for li, base in enumerate(lemmas):
+        lemma_of[sid[base]] = li
+        lemma_sid.append(sid[base])
+        entry = table[base]
+        for slot, key in enumerate(FORMS):
+            form = entry.get(key)
+            if form is None:
+                forms.append(NONE)
+            else:
+                forms.append(sid[form])
+                reverse[sid[form]].append(li * len(FORMS) + slot)
+
+    rev_offsets = array("I", [0])
+    rev_entries = array("I")
+    for entries in reverse:
+        rev_entries.extend(entries)
+        rev_offsets.append(len(rev_entries))
+
+    n_slots = 1
+    while n_slots < 2 * len(encoded):
+        n_slots <<= 1
+    slots = array("I", [NONE]) * n_slots
+    for i, s in enumerate(encoded):
+        h = zlib.crc32(s) & (n_slots - 1)
+        while slots[h] != NONE:
+            h = (h + 1) & (n_slots - 1)
+        slots[h] = i
+
+    with open(path, "wb") as f:
+        f.write(_HEADER.pack(MAGIC, len(encoded), len(lemmas), len(rev_entries), n_slots))
+        for arr in (str_offsets, lemma_of, lemma_sid, forms, rev_offsets, rev_entries, slots):
+            f.write(arr.tobytes())
+        f.write(b"".join(encoded))
+
+
+def read_tsv(path: str) -> Dict[str, Dict[str, str]]:
+    table = {}
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            cols = line.split()
+            if len(cols) == 1 + len(FORMS):
+                table[cols[0]] = dict(zip(FORMS, cols[1:]))
+    return table
+
+
+class Lexicon(Mapping):
+
+    def __init__(self, path: str):
+        if sys.byteorder != "little":
+            raise ValueError("lexicon files are little endian")
+        self.path = path
+        self._file = open(path, "rb")
+        self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, n_strings, n_lemmas, n_rev, n_slots = _HEADER.unpack_from(self._mm)
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a lexicon file")
+
+        view = memoryview(self._mm)
+        pos = _HEADER.size
+        arrays = []
+        for count in (n_strings + 1, n_strings, n_lemmas, n_lemmas * len(FORMS), n_strings + 1, n_rev, n_slots):
+            arrays.append(view[pos:pos + count * 4].cast("I"))
+            pos += count * 4
+        (self._str_offsets, self._lemma_of, self._lemma_sid,
+         self._forms, self._rev_offsets, self._rev_entries, self._slots) = arrays
+        self._strings_at = pos
+        self._mask = n_slots - 1
+        self._views = arrays
+
+    def __reduce__(self):
+        # mmap cannot be pickled; worker processes reopen the file
+        return Lexicon, (self.path,)
+
+    def _string(self, sid: int) -> str:
+        base = self._strings_at
+        return self._mm[base + self._str_offsets[sid]:base + self._str_offsets[sid + 1]].decode("utf-8")
+
+    def _find(self, s: str) -> int:
+        key = s.encode("utf-8")
+        base, offsets, slots, mm, mask = self._strings_at, self._str_offsets, self._slots, self._mm, self._mask
+        h = zlib.crc32(key) & mask
+        while True:
+            sid = slots[h]
+            if sid == NONE:
+                return -1
+            if mm[base + offsets[sid]:base + offsets[sid + 1]] == key:
+                return sid
+            h = (h + 1) & mask
+
+    def _lemma_forms(self, li: int) -> Dict[str, str]:
+        out = {}
+        for slot, key in enumerate(FORMS):
+            sid = self._forms[li * len(FORMS) + slot]
+            if sid != NONE:
+                out[key] = self._string(sid)
+        return out
+
+    # --------- Mapping: base -> forms ---------
+
+    def __getitem__(self, base: str) -> Dict[str, str]:
+        sid = self._find(base)
+        li = self._lemma_of[sid] if sid >= 0 else NONE
+        if li == NONE:
+            raise KeyError(base)
+        return self._lemma_forms(li)
+
+    def __contains__(self, base) -> bool:
+        sid = self._find(base) if isinstance(base, str) else -1
+        return sid >= 0 and self._lemma_of[sid] != NONE
+
+    def __iter__(self) -> Iterator[str]:
+        for sid in self._lemma_sid:
+            yield self._string(sid)
+
+    def __len__(self) -> int:
+        return len(self._lemma_sid)
+
+    # --------- reverse lookup ---------
+
+    def lemmas(self, form: str) -> List[Tuple[str, str]]:
+        # "went" -> [("go", "past")]; a base form maps to itself with slot "base"
+        sid = self._find(form)
+        if sid < 0:
+            return []
+        out = []
+        if self._lemma_of[sid] != NONE:
+            out.append((form, "base"))
+        for k in range(self._rev_offsets[sid], self._rev_offsets[sid + 1]):
+            li, slot = divmod(self._rev_entries[k], len(FORMS))
+            out.append((self._string(self._lemma_sid[li]), FORMS[slot]))
+        return out
+
+    def close(self) -> None:
+        for v in self._views:
+            v.release()
+        self._mm.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    sub = parser.add_subparsers(dest="cmd", required=True)
+    p_build = sub.add_parser("build")
+    p_build.add_argument("path")
+    p_build.add_argument("--tsv", help="base past pp s3 ing per line (default: generate.IRREGULARS)")
+    p_lookup = sub.add_parser("lookup")
+    p_lookup.add_argument("path")
+    p_lookup.add_argument("words", nargs="+")
+    args = parser.parse_args()
+
+    if args.cmd == "build":
+        if args.tsv:
+            table = read_tsv(args.tsv)
+        else:
+            from generate import IRREGULARS
+            table = IRREGULARS
+        build_lexicon(table, args.path)
+        print(f"{args.path}: {len(table)} lemmas")
+        return
+
+    with Lexicon(args.path) as lex:
+        for w in args.words:
+            print(w, lex.get(w), lex.lemmas(w))
+
+
+if __name__ == "__main__":
+    main()
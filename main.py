@@ -1,85 +1,62 @@
-
-import json
-from pathlib import Path
-
-
-def get_token_encoder(tokenizer: str | None = None):
-
-    tokenizer = (tokenizer or "gpt2").lower()
-
-    if tokenizer == "gpt2":
-        from transformers import GPT2TokenizerFast
-        tok = GPT2TokenizerFast.from_pretrained("gpt2")
-        return lambda s: len(tok.encode(s))
-
-    # otherwise: tiktoken
-    import tiktoken
-
-    enc = tiktoken.get_encoding("gpt2")
-    return lambda s: len(enc.encode(s))
-
-
-def txt_to_jsonl(in_path: str, out_path: str, encoding: str = "utf-8") -> None:
-    with open(in_path, "r", encoding=encoding) as fin, open(out_path, "w", encoding=encoding) as fout:
-        for line in fin:
-            txt = line.strip()
-
-            if not txt:
-                continue
-
-            pos = txt.find(" is ")
-            subject = None
-            if pos > 0:
-                subject = txt[0:pos]
-
-            if subject is not None:
-                rec = {"verb": "", "meaning": f'definition of "{subject}"', "example": txt}
-            fout.write(json.dumps(rec, ensure_ascii=False) + "\n")
-
-
+from encoders import get_backend, get_token_encoder  # noqa: F401  (get_token_encoder re-exported for old callers)
+from profiling import profiled
+from stats_cache import cached_count_jsonl_tokens
+from token_count import count_jsonl_tokens
+from txt_convert import convert_file
+
+
+@profiled("txt_to_jsonl")
+def txt_to_jsonl(in_path: str, out_path: str, encoding: str = "utf-8",
+                 reject_path: str | None = None, workers: int = 0) -> dict:
+    # lines without " is " go to reject_path (or are dropped) instead of the output
+    stats = convert_file(in_path, out_path, reject_path, encoding, workers)
+    print(f"{in_path}: {stats}")
+    return stats
+
+
+@profiled("analytics")
+def analytics(jsonl_path: str, tokenizer: str = "gpt2", top: int = 20) -> dict:
+    # token-id frequencies, headword splits and coverage growth (see token_analytics);
+    # imported here so plain runs do not pay for numpy
+    from token_analytics import count_jsonl, print_report
+    freq = count_jsonl(jsonl_path, tokenizer)
+    report = freq.report(get_backend(tokenizer).decode, top, top)
+    print_report(report)
+    return report
+
+
+@profiled("main")
 def main():
 
-    #txt_to_jsonl("input.txt", "output.jsonl")
+    #txt_to_jsonl("input.txt", "output.jsonl", reject_path="rejected.txt")
+    #exit(0)
+
+    #analytics("wordacy-train.jsonl")
     #exit(0)
 
     jsonl_path = "wordacy-train.jsonl"
 
     def_dict = dict()
 
-    count_encoder = get_token_encoder()
-
-    total_tokens = 0
-    total_items = 0
-    max_tokens = 0
-
-    path = Path(jsonl_path)
-
-    with path.open("r", encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            obj = json.loads(line)
-
-            val = obj.get("example")
-            definition = obj.get("definition", None)
-
-            if (definition is not None) and (definition != "") and (definition.find("definition") == 0):
-                if definition not in def_dict:
-                    def_dict[definition] = "definition"
-                else:
-                    print(definition)
-
-            if val is None or val == "":
-                continue
-
-            if definition is not None:
-                val = definition + ": " + val
-            count = count_encoder(val)
-
-            total_tokens += count
-            total_items += 1
-            max_tokens = max(max_tokens, count)
+    def check_definition(definition: str) -> None:
+        if definition.find("definition") == 0:
+            if definition not in def_dict:
+                def_dict[definition] = "definition"
+            else:
+                print(definition)
+
+    # re-runs only tokenize new or changed lines; None disables the cache
+    cache_path = "wordacy-train.tokcache"
+
+    if cache_path:
+        total_tokens, total_items, max_tokens = cached_count_jsonl_tokens(
+            jsonl_path, cache_path, chunk_size=1024, on_duplicate=print
+        )
+    else:
+        # workers > 0 spreads tokenization over a process pool
+        total_tokens, total_items, max_tokens = count_jsonl_tokens(
+            jsonl_path, chunk_size=1024, workers=0, on_definition=check_definition
+        )
 
     print(f"wordacy.jsonl: tokens = {total_tokens}, examples = {total_items}, max_tokens = {max_tokens}")
 
@@ -0,0 +1,267 @@
+"""
+Sequence packing for short SFT records.
+
+Works on a token_dataset export (record lengths come straight from its offsets
+index, nothing is re-tokenized). Records are binned into fixed seq_len rows with
+first-fit-decreasing ("ffd", best packing, needs all lengths in memory) or a
+streaming greedy best-fit over a window of open rows ("greedy", constant
+memory, keeps input order roughly intact). Records longer than seq_len are
+truncated, empty ones skipped.
+
+Each shard is written as
+
+    <out>-NNNNN.bin   rows of exactly seq_len tokens, padded with pad_id
+    <out>-NNNNN.idx   uint64 seg_offsets[rows + 1], then uint32 (record, length, prompt_len) per segment
+    <out>-NNNNN.json  metadata
+
+so row i is tokens[i * seq_len:(i + 1) * seq_len] and its segments give the
+attention boundaries (cu_seqlens) and the loss mask (target tokens only).
+
+    python token_dataset.py verbs_sft.jsonl verbs_sft
+    python packing.py verbs_sft verbs_sft-packed --seq-len 128
+"""
+import argparse
+import json
+import mmap
+import sys
+import time
+from array import array
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+from token_dataset import TokenDataset
+
+
+def record_lengths(ds: TokenDataset) -> array:
+    offsets = ds.offsets
+    return array("I", (offsets[i + 1] - offsets[i] for i in range(len(ds))))
+
+
+def pack_ffd(lengths: array, seq_len: int) -> List[List[int]]:
+    """
+    First-fit-decreasing; rows are looked up by free space, so placing an item
+    costs at most seq_len probes instead of a scan over all open rows.
+    """
+    order = sorted(range(len(lengths)), key=lambda i: lengths[i], reverse=True)
+    bins: List[List[int]] = []
+    # free space -> rows with exactly that much room left
+    by_space: Dict[int, List[int]] = {}
+
+    for i in order:
+        n = min(lengths[i], seq_len)
+        if n == 0:
+            continue
+        row = None
+        for space in range(n, seq_len + 1):
+            rows = by_space.get(space)
+            if rows:
+                row = rows.pop()
+                left = space - n
+                break
+        if row is None:
+            row = len(bins)
+            bins.append([])
+            left = seq_len - n
+        bins[row].append(i)
+        if left:
+            by_space.setdefault(left, []).append(row)
+
+    return bins
+
+
+def pack_greedy(lengths: Iterable[int], seq_len: int, window: int = 64) -> Iterator[List[int]]:
+    # streaming best-fit: the fullest row is flushed when the window overflows
+    open_rows: List[Tuple[int, List[int]]] = []   # (free space, record ids)
+
+    for i, n in enumerate(lengths):
+        n = min(n, seq_len)
+        if n == 0:
+            continue
+        best = -1
+        for j, (space, _) in enumerate(open_rows):
+            if space >= n and (best < 0 or space < open_rows[best][0]):
+                best = j
+        if best >= 0:
+            space, ids = open_rows[best]
+            ids.append(i)
+            open_rows[best] = (space - n, ids)
+            if space == n:
+                yield open_rows.pop(best)[1]
+            continue
+
+        if len(open_rows) >= window:
+            fullest = min(range(len(open_rows)), key=lambda j: open_rows[j][0])
+            yield open_rows.pop(fullest)[1]
+        open_rows.append((seq_len - n, [i]))
+
+    for _, ids in open_rows:
+        yield ids
+
+
+def shard_prefix(out: str, index: int) -> str:
+    return f"{out}-{index:05d}"
+
+
+def write_packed(ds: TokenDataset, bins: Iterable[List[int]], out: str, seq_len: int,
+                 pad_id: int = 0, shard_rows: int = 100_000) -> dict:
+    typecode = ds.tokens.format
+    stats = {"rows": 0, "records": 0, "real_tokens": 0, "truncated": 0, "shards": 0}
+
+    def flush(shard: int, tokens: array, seg_offsets: array, segments: array) -> None:
+        prefix = shard_prefix(out, shard)
+        Path(prefix + ".bin").write_bytes(tokens.tobytes())
+        Path(prefix + ".idx").write_bytes(seg_offsets.tobytes() + segments.tobytes())
+        rows = len(seg_offsets) - 1
+        meta = {
+            "source": ds.meta["source"],
+            "tokenizer": ds.meta["tokenizer"],
+            "dtype": ds.meta["dtype"],
+            "byteorder": sys.byteorder,
+            "seq_len": seq_len,
+            "pad_id": pad_id,
+            "rows": rows,
+            "segments": len(segments) // 3,
+        }
+        Path(prefix + ".json").write_text(json.dumps(meta, indent=2), encoding="utf-8")
+
+    tokens, seg_offsets, segments = array(typecode), array("Q", [0]), array("I")
+    for ids in bins:
+        used = 0
+        for i in ids:
+            rec = ds[i]
+            n = min(len(rec), seq_len - used)
+            if n < len(rec):
+                stats["truncated"] += 1
+            tokens.extend(rec[:n])
+            segments.extend((i, n, min(ds.prompt_len(i), n)))
+            used += n
+        tokens.extend([pad_id] * (seq_len - used))
+        seg_offsets.append(len(segments) // 3)
+
+        stats["rows"] += 1
+        stats["records"] += len(ids)
+        stats["real_tokens"] += used
+
+        if len(seg_offsets) - 1 >= shard_rows:
+            flush(stats["shards"], tokens, seg_offsets, segments)
+            stats["shards"] += 1
+            tokens, seg_offsets, segments = array(typecode), array("Q", [0]), array("I")
+
+    if len(seg_offsets) > 1:
+        flush(stats["shards"], tokens, seg_offsets, segments)
+        stats["shards"] += 1
+
+    slots = stats["rows"] * seq_len
+    stats["efficiency"] = round(stats["real_tokens"] / slots, 4) if slots else 0.0
+    return stats
+
+
+def bucket_efficiency(lengths: array, batch_size: int) -> Dict[str, float]:
+    # padding baseline without packing: real / slot tokens when batches are
+    # padded to their own max, in input order and after sorting by length
+    def eff(seq: List[int]) -> float:
+        slots = sum(max(seq[i:i + batch_size]) * len(seq[i:i + batch_size]) for i in range(0, len(seq), batch_size))
+        return round(sum(seq) / slots, 4) if slots else 0.0
+
+    seq = list(lengths)
+    return {"padded": eff(seq), "length_bucketed": eff(sorted(seq))}
+
+
+class PackedDataset:
+    """
+    One packed shard: ds[i] is a seq_len memoryview of token ids,
+    ds.segments(i) the (record, length, prompt_len) triples of row i.
+    """
+
+    def __init__(self, prefix: str):
+        self.meta = json.loads(Path(prefix + ".json").read_text(encoding="utf-8"))
+        self.seq_len = self.meta["seq_len"]
+        rows = self.meta["rows"]
+
+        self._fbin = open(prefix + ".bin", "rb")
+        self._fidx = open(prefix + ".idx", "rb")
+        self._mbin = mmap.mmap(self._fbin.fileno(), 0, access=mmap.ACCESS_READ)
+        self._midx = mmap.mmap(self._fidx.fileno(), 0, access=mmap.ACCESS_READ)
+
+        self.tokens = memoryview(self._mbin).cast("H" if self.meta["dtype"] == "uint16" else "I")
+        idx = memoryview(self._midx)
+        self.seg_offsets = idx[:(rows + 1) * 8].cast("Q")
+        self.segment_table = idx[(rows + 1) * 8:].cast("I")
+
+    def __len__(self) -> int:
+        return self.meta["rows"]
+
+    def __getitem__(self, i: int) -> memoryview:
+        return self.tokens[i * self.seq_len:(i + 1) * self.seq_len]
+
+    def segments(self, i: int) -> List[Tuple[int, int, int]]:
+        t = self.segment_table
+        return [(t[k * 3], t[k * 3 + 1], t[k * 3 + 2]) for k in range(self.seg_offsets[i], self.seg_offsets[i + 1])]
+
+    def cu_seqlens(self, i: int) -> List[int]:
+        out = [0]
+        for _, n, _ in self.segments(i):
+            out.append(out[-1] + n)
+        return out
+
+    def loss_mask(self, i: int) -> bytearray:
+        mask = bytearray(self.seq_len)
+        pos = 0
+        for _, n, prompt_len in self.segments(i):
+            mask[pos + prompt_len:pos + n] = b"\x01" * (n - prompt_len)
+            pos += n
+        return mask
+
+    def close(self) -> None:
+        self.tokens.release()
+        self.seg_offsets.release()
+        self.segment_table.release()
+        self._mbin.close()
+        self._midx.close()
+        self._fbin.close()
+        self._fidx.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("dataset", help="token_dataset export prefix")
+    parser.add_argument("out", help="output prefix, writes <out>-NNNNN.bin/.idx/.json")
+    parser.add_argument("--seq-len", type=int, default=512)
+    parser.add_argument("--algo", choices=["ffd", "greedy"], default="ffd")
+    parser.add_argument("--window", type=int, default=64)
+    parser.add_argument("--pad-id", type=int, default=0)
+    parser.add_argument("--shard-rows", type=int, default=100_000)
+    parser.add_argument("--batch-size", type=int, default=32)
+    args = parser.parse_args()
+
+    with TokenDataset(args.dataset) as ds:
+        lengths = record_lengths(ds)
+
+        t0 = time.perf_counter()
+        if args.algo == "ffd":
+            bins = pack_ffd(lengths, args.seq_len)
+            pack_s = time.perf_counter() - t0
+        else:
+            # streamed straight into the writer
+            bins = pack_greedy(lengths, args.seq_len, args.window)
+            pack_s = None
+
+        stats = write_packed(ds, bins, args.out, args.seq_len, args.pad_id, args.shard_rows)
+        dt_total = time.perf_counter() - t0
+
+    n = max(len(lengths), 1)
+    if pack_s is not None:
+        stats["pack_s_per_1m_records"] = round(pack_s / n * 1e6, 3)
+    stats["total_s_per_1m_records"] = round(dt_total / n * 1e6, 3)
+    stats.update(bucket_efficiency(lengths, args.batch_size))
+    print(json.dumps(stats))
+
+
+if __name__ == "__main__":
+    main()
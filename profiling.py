@@ -0,0 +1,229 @@
+"""
+Stage-level instrumentation for the data scripts.
+
+Off by default. Turn it on with environment variables (or enable_profiling()):
+
+    WORDACY_PROFILE=profile.jsonl     # or "-" for stderr
+    WORDACY_PROFILE_MODE=stages       # stages (default) | cprofile | sample
+
+Entry points (main.main, main.txt_to_jsonl, generate.generate_jsonl) are
+wrapped with @profiled. Inner loops ask active_profiler() once and, only when
+it is not None, swap their I/O, json.loads, text building and encode calls for
+Profiler.timed() / timed_iter() wrappers, so a disabled run executes exactly
+the uninstrumented code.
+
+Every run writes JSON lines: one {"type": "stage"} per stage with wall and CPU
+seconds (process CPU time, all threads, not pool workers), calls, bytes
+read/written, records and records/s, then one {"type": "run"} summary with
+peak RSS (this process and its pool workers).
+cprofile mode also dumps <out>.<run>.prof (pstats format); sample mode adds
+{"type": "sample"} lines with the hottest stacks seen by a SIGPROF sampler.
+"""
+import cProfile
+import functools
+import json
+import os
+import resource
+import signal
+import sys
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator
+
+_profiler = None
+_SAMPLE_INTERVAL = 0.005
+_SAMPLE_DEPTH = 12
+
+
+class StageStats:
+
+    __slots__ = ("name", "wall", "cpu", "calls", "bytes_read", "bytes_written", "records")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.wall = 0.0
+        self.cpu = 0.0
+        self.calls = 0
+        self.bytes_read = 0
+        self.bytes_written = 0
+        self.records = 0
+
+    def to_dict(self) -> dict:
+        return {
+            "type": "stage",
+            "stage": self.name,
+            "wall_s": round(self.wall, 6),
+            "cpu_s": round(self.cpu, 6),
+            "calls": self.calls,
+            "bytes_read": self.bytes_read,
+            "bytes_written": self.bytes_written,
+            "records": self.records,
+            "records_per_s": round(self.records / self.wall) if self.wall > 0 else 0,
+        }
+
+
+class Profiler:
+
+    def __init__(self, out: str, mode: str = "stages"):
+        if mode not in ("stages", "cprofile", "sample"):
+            raise ValueError(f"unknown profiling mode: {mode}")
+        self.out = out
+        self.mode = mode
+        self.stages: Dict[str, StageStats] = {}
+        self.samples: Dict[str, int] = {}
+        self._depth = 0
+
+    def get(self, name: str) -> StageStats:
+        st = self.stages.get(name)
+        if st is None:
+            st = self.stages[name] = StageStats(name)
+        return st
+
+    def timed(self, name: str, fn, records=None, bytes_read=None, bytes_written=None):
+        """
+        Wraps fn so every call is added to stage `name`. records / bytes_read /
+        bytes_written are optional callables on the first argument (default: one
+        record per call); byte counts are bytes, so encode str arguments first.
+        """
+        st = self.get(name)
+        pc, cpu = time.perf_counter, time.process_time
+
+        def inner(*args):
+            t0, c0 = pc(), cpu()
+            try:
+                return fn(*args)
+            finally:
+                st.wall += pc() - t0
+                st.cpu += cpu() - c0
+                st.calls += 1
+                st.records += records(args[0]) if records else 1
+                if bytes_read:
+                    st.bytes_read += bytes_read(args[0])
+                if bytes_written:
+                    st.bytes_written += bytes_written(args[0])
+        return inner
+
+    def timed_iter(self, name: str, iterable, records=None, bytes_read=None):
+        # times every next() on iterable; records / bytes_read are callables on the item
+        st = self.get(name)
+        pc, cpu = time.perf_counter, time.process_time
+        it = iter(iterable)
+        while True:
+            t0, c0 = pc(), cpu()
+            try:
+                item = next(it)
+            except StopIteration:
+                st.wall += pc() - t0
+                st.cpu += cpu() - c0
+                return
+            st.wall += pc() - t0
+            st.cpu += cpu() - c0
+            st.calls += 1
+            st.records += records(item) if records else 1
+            if bytes_read:
+                st.bytes_read += bytes_read(item)
+            yield item
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[StageStats]:
+        st = self.get(name)
+        w0, c0 = time.perf_counter(), time.process_time()
+        try:
+            yield st
+        finally:
+            st.wall += time.perf_counter() - w0
+            st.cpu += time.process_time() - c0
+            st.calls += 1
+
+    # --------- sampling ---------
+
+    def _on_sample(self, signum, frame) -> None:
+        stack = []
+        while frame is not None and len(stack) < _SAMPLE_DEPTH:
+            code = frame.f_code
+            stack.append(f"{os.path.basename(code.co_filename)}:{code.co_name}")
+            frame = frame.f_back
+        key = ";".join(reversed(stack))
+        self.samples[key] = self.samples.get(key, 0) + 1
+
+    # --------- output ---------
+
+    def emit(self, run: str, wall: float) -> None:
+        lines = [st.to_dict() for st in self.stages.values()]
+        for stack, count in sorted(self.samples.items(), key=lambda kv: -kv[1])[:50]:
+            lines.append({"type": "sample", "stack": stack, "count": count})
+        lines.append({
+            "type": "run",
+            "run": run,
+            "mode": self.mode,
+            "wall_s": round(wall, 6),
+            # ru_maxrss is KiB on Linux
+            "peak_rss_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+            "peak_rss_children_kb": resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss,
+        })
+        text = "".join(json.dumps(dict(line, run=run)) + "\n" for line in lines)
+        if self.out == "-":
+            sys.stderr.write(text)
+        else:
+            with open(self.out, "a", encoding="utf-8") as f:
+                f.write(text)
+        self.stages = {}
+        self.samples = {}
+
+
+def enable_profiling(out: str, mode: str = "stages") -> Profiler:
+    global _profiler
+    _profiler = Profiler(out, mode)
+    return _profiler
+
+
+def disable_profiling() -> None:
+    global _profiler
+    _profiler = None
+
+
+def active_profiler() -> Profiler | None:
+    return _profiler
+
+
+def profiled(run: str):
+    """
+    Decorator for pipeline entry points: times the whole call as stage `run`
+    and emits the report when the outermost profiled call returns.
+    """
+    def wrap(fn):
+        @functools.wraps(fn)
+        def inner(*args, **kwargs):
+            prof = _profiler
+            if prof is None:
+                return fn(*args, **kwargs)
+
+            prof._depth += 1
+            outer = prof._depth == 1
+            cprof = cProfile.Profile() if outer and prof.mode == "cprofile" else None
+            sampling = outer and prof.mode == "sample"
+            if sampling:
+                old_handler = signal.signal(signal.SIGPROF, prof._on_sample)
+                signal.setitimer(signal.ITIMER_PROF, _SAMPLE_INTERVAL, _SAMPLE_INTERVAL)
+
+            w0 = time.perf_counter()
+            try:
+                with prof.stage(run):
+                    if cprof is not None:
+                        return cprof.runcall(fn, *args, **kwargs)
+                    return fn(*args, **kwargs)
+            finally:
+                prof._depth -= 1
+                if sampling:
+                    signal.setitimer(signal.ITIMER_PROF, 0, 0)
+                    signal.signal(signal.SIGPROF, old_handler)
+                if cprof is not None and prof.out != "-":
+                    cprof.dump_stats(f"{prof.out}.{run}.prof")
+                if outer:
+                    prof.emit(run, time.perf_counter() - w0)
+        return inner
+    return wrap
+
+
+if os.environ.get("WORDACY_PROFILE"):
+    enable_profiling(os.environ["WORDACY_PROFILE"], os.environ.get("WORDACY_PROFILE_MODE", "stages"))
@@ -0,0 +1,10 @@
+"""
+Shard file naming shared by the JSONL writers (generate.py, shuffle_split.py).
+"""
+from pathlib import Path
+
+
+def shard_path(out_path: str, index: int) -> str:
+    # verbs_sft.jsonl -> verbs_sft-00000.jsonl
+    p = Path(out_path)
+    return str(p.with_name(f"{p.stem}-{index:05d}{p.suffix}"))
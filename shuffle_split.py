@@ -0,0 +1,247 @@
+"""
+Deterministic train/valid/test split + shuffle for JSONL files larger than RAM.
+
+Every record gets a group key, by default its headword: the first quoted
+string of "question" / "definition" / "meaning" (so all templates of one verb,
+or all records about one word, share a key), else "verb", else the line. The
+split is picked by a salted hash of that key, so a group never straddles two
+splits and the assignment does not depend on the shuffle seed, the input
+order or the other files.
+
+The shuffle is the classic two-pass external shuffle:
+
+    pass 1  stream the sources in byte blocks, append each line to a random
+            bucket file of its split (seeded RNG), sequential writes only
+    pass 2  per split, load one bucket at a time, shuffle its lines in memory
+            and append them to the output shards
+
+Pass 1 keeps no bucket file open: each bucket buffers its lines in memory and
+appends them to its file (open, write, close) once the buffer is full, so it
+needs one file descriptor whatever --buckets is. The buffers share a budget
+of _WRITE_BUDGET (32 MiB) and shrink as splits x buckets grows, down to
+_MIN_FLUSH (16 KiB) per bucket, i.e. more buckets mean smaller, more
+frequent appends rather than more memory (until splits x buckets x 16 KiB
+exceeds the budget, e.g. 3 x 1024 buckets = 48 MiB).
+
+Peak memory in pass 2 is about the largest bucket, i.e. input size / --buckets. Output is
+a pure function of (sources in order, --seed, --salt, --buckets, --split).
+
+    python shuffle_split.py wordacy-train.jsonl verbs_sft.jsonl --out data --seed 1
+    -> data/train-00000.jsonl ..., data/valid-00000.jsonl, data/test-00000.jsonl, data/manifest.json
+"""
+import argparse
+import hashlib
+import json
+import random
+import re
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Sequence, Tuple
+
+from jsonl_reader import get_field_decoder, iter_lines
+from shards import shard_path
+
+GROUP_FIELDS = ("question", "definition", "meaning", "verb")
+DEFAULT_SPLITS = ("train=0.98", "valid=0.01", "test=0.01")
+_QUOTED = re.compile(r'"([^"]+)"')
+_WRITE_BUDGET = 32 << 20
+_MIN_FLUSH = 16 << 10
+_MAX_FLUSH = 256 << 10
+
+
+def headword(question: str | None, definition: str | None, meaning: str | None, verb: str | None) -> str | None:
+    for text in (question, definition, meaning):
+        if text:
+            m = _QUOTED.search(text)
+            if m:
+                return m.group(1).lower()
+    return verb or None
+
+
+def split_point(key: bytes, salt: bytes = b"") -> float:
+    # stable position of a group key in [0, 1)
+    h = hashlib.blake2b(key, digest_size=8, key=salt).digest()
+    return int.from_bytes(h, "little") / (1 << 64)
+
+
+def parse_splits(specs: Sequence[str]) -> List[Tuple[str, float]]:
+    # ["train=0.98", "valid=0.01", ...] -> cumulative upper bounds [("train", 0.98), ("valid", 0.99), ...]
+    splits = []
+    for spec in specs:
+        name, sep, ratio = spec.partition("=")
+        if not sep or not name or float(ratio) < 0:
+            raise ValueError(f"bad split {spec!r}, expected name=ratio")
+        splits.append((name, float(ratio)))
+    total = sum(r for _, r in splits)
+    if total <= 0:
+        raise ValueError("split ratios sum to zero")
+
+    bounds = []
+    acc = 0.0
+    for name, ratio in splits:
+        acc += ratio / total
+        bounds.append((name, acc))
+    bounds[-1] = (bounds[-1][0], 1.0)
+    return bounds
+
+
+def assign_split(u: float, bounds: List[Tuple[str, float]]) -> int:
+    for i, (_, upper) in enumerate(bounds):
+        if u < upper:
+            return i
+    return len(bounds) - 1
+
+
+def _bucket_path(tmp: Path, split: str, bucket: int) -> Path:
+    return tmp / f"{split}-{bucket:05d}.jsonl"
+
+
+def scatter(sources: Sequence[str], tmp: Path, bounds: List[Tuple[str, float]], buckets: int,
+            seed: int, salt: bytes = b"", group_by: str = "headword") -> Dict[str, int]:
+    """
+    Pass 1: appends every line to a random bucket file of its split, through
+    per-bucket memory buffers (see the module docstring). Returns the number
+    of records per split.
+    """
+    decode = get_field_decoder(GROUP_FIELDS)
+    rand = random.Random(seed).random
+    paths = [[_bucket_path(tmp, name, b) for b in range(buckets)] for name, _ in bounds]
+    pending = [[bytearray() for _ in range(buckets)] for _ in bounds]
+    flush_at = min(max(_WRITE_BUDGET // (len(bounds) * buckets), _MIN_FLUSH), _MAX_FLUSH)
+    counts = [0] * len(bounds)
+    groups: Dict[bytes, int] = {}
+
+    def flush(s: int, b: int) -> None:
+        with paths[s][b].open("ab") as f:
+            f.write(pending[s][b])
+        pending[s][b].clear()
+
+    for path in sources:
+        for line in iter_lines(path):
+            key = None
+            if group_by == "headword":
+                key = headword(*decode(line))
+            key = line if key is None else key.encode("utf-8")
+
+            # one split per group, cached: groups repeat (21 templates per verb)
+            s = groups.get(key)
+            if s is None:
+                s = groups[key] = assign_split(split_point(key, salt), bounds)
+                if len(groups) > 1 << 20:
+                    groups.clear()
+            counts[s] += 1
+            b = int(rand() * buckets)
+            buf = pending[s][b]
+            buf += line
+            buf += b"\n"
+            if len(buf) >= flush_at:
+                flush(s, b)
+
+    for s, row in enumerate(pending):
+        for b, buf in enumerate(row):
+            if buf:
+                flush(s, b)
+
+    return {name: n for (name, _), n in zip(bounds, counts)}
+
+
+def gather(tmp: Path, out_dir: Path, split: str, buckets: int, seed: int, shard_records: int) -> List[str]:
+    """
+    Pass 2: shuffles one bucket at a time into <out_dir>/<split>-NNNNN.jsonl
+    shards of shard_records lines. Returns the shard file names.
+    """
+    rng = random.Random(f"{seed}:{split}")
+    shards: List[str] = []
+    fout = None
+    room = 0
+
+    try:
+        for b in range(buckets):
+            path = _bucket_path(tmp, split, b)
+            if not path.exists():  # no line drawn this bucket
+                continue
+            lines = path.read_bytes().split(b"\n")
+            path.unlink()
+            lines.pop()  # every line ends with "\n"
+            rng.shuffle(lines)
+
+            pos = 0
+            while pos < len(lines):
+                if room == 0:
+                    if fout is not None:
+                        fout.close()
+                    name = shard_path(str(out_dir / f"{split}.jsonl"), len(shards))
+                    fout = open(name, "wb")
+                    shards.append(Path(name).name)
+                    room = shard_records
+                take = lines[pos:pos + room]
+                fout.write(b"\n".join(take) + b"\n")
+                pos += len(take)
+                room -= len(take)
+    finally:
+        if fout is not None:
+            fout.close()
+
+    return shards
+
+
+def shuffle_split(sources: Sequence[str], out_dir: str, splits: Sequence[str] = DEFAULT_SPLITS,
+                  seed: int = 0, salt: str = "", buckets: int = 64, shard_records: int = 100_000,
+                  group_by: str = "headword", tmp_dir: str | None = None) -> dict:
+    bounds = parse_splits(splits)
+    out = Path(out_dir)
+    out.mkdir(parents=True, exist_ok=True)
+    in_bytes = sum(Path(p).stat().st_size for p in sources)
+
+    # bucket files default to the output disk, where the shards end up anyway
+    with tempfile.TemporaryDirectory(dir=tmp_dir or out) as tmp:
+        tmp = Path(tmp)
+
+        t0 = time.perf_counter()
+        counts = scatter(sources, tmp, bounds, buckets, seed, salt.encode("utf-8"), group_by)
+        t1 = time.perf_counter()
+        shards = {name: gather(tmp, out, name, buckets, seed, shard_records) for name, _ in bounds}
+        t2 = time.perf_counter()
+
+    manifest = {
+        "sources": [str(p) for p in sources],
+        "seed": seed,
+        "salt": salt,
+        "buckets": buckets,
+        "group_by": group_by,
+        "splits": {name: {"records": counts[name], "shards": shards[name]} for name, _ in bounds},
+    }
+    (out / "manifest.json").write_text(json.dumps(manifest, indent=2) + "\n", encoding="utf-8")
+
+    mb = in_bytes / (1 << 20)
+    return {
+        "records": sum(counts.values()),
+        "splits": counts,
+        "bytes": in_bytes,
+        "scatter_mb_per_s": round(mb / (t1 - t0), 2) if t1 > t0 else 0.0,
+        "gather_mb_per_s": round(mb / (t2 - t1), 2) if t2 > t1 else 0.0,
+        "seconds": round(t2 - t0, 3),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("sources", nargs="+")
+    parser.add_argument("--out", required=True, help="output directory")
+    parser.add_argument("--split", nargs="+", default=list(DEFAULT_SPLITS), help="name=ratio ...")
+    parser.add_argument("--seed", type=int, default=0, help="shuffle seed")
+    parser.add_argument("--salt", default="", help="split hash salt (a new salt re-draws the split)")
+    parser.add_argument("--buckets", type=int, default=64, help="pass 2 peak memory ~ input size / buckets")
+    parser.add_argument("--shard-records", type=int, default=100_000)
+    parser.add_argument("--group-by", choices=("headword", "line"), default="headword")
+    parser.add_argument("--tmp", help="directory for the bucket files (default: --out)")
+    args = parser.parse_args()
+
+    stats = shuffle_split(args.sources, args.out, args.split, args.seed, args.salt, args.buckets,
+                          args.shard_records, args.group_by, args.tmp)
+    print(json.dumps(stats))
+
+
+if __name__ == "__main__":
+    main()
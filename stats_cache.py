@@ -0,0 +1,260 @@
+"""
+Incremental, content-hash-cached token counting for main.main().
+
+Every non-empty JSONL line is keyed by an 8-byte blake2b hash, keyed with the
+tokenizer id, so one cache file can serve several tokenizers. The cached value
+is the token count of the line's text (-1 if it has none) plus a hash of its
+"definition..." field for the duplicate report. On a re-run only new or
+changed lines are parsed and tokenized; the rest costs one hash and one lookup.
+
+Cache file layout (little endian):
+
+    header    b"WTC1", uint32 reserved, uint64 n_sorted
+    sorted    uint64 keys[n_sorted], int32 counts[n_sorted], uint64 defs[n_sorted]
+    tail      (uint64 key, int32 count, uint64 def) per line appended since the last compaction
+
+The sorted region is loaded straight into arrays and searched with bisect; the
+tail goes into a dict. close() compacts (merges the tail into the sorted
+region) once the tail grows past compact_ratio of it, once more than
+compact_ratio of the entries were not seen in this run, or when the cache
+holds more than max_entries. Compaction drops the entries not seen in this
+run, so the cache tracks the current file instead of growing with every edit
+(keep_unseen=True keeps them, e.g. for one cache shared by several
+tokenizers), then trims to max_entries, oldest first.
+"""
+import hashlib
+import struct
+from array import array
+from bisect import bisect_left
+from itertools import islice
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+
+from encoders import get_batch_token_encoder, normalize_name
+from jsonl_reader import get_field_decoder, iter_lines
+from profiling import active_profiler
+from token_count import TEXT_FIELDS, join_text
+
+MAGIC = b"WTC1"
+_HEADER = struct.Struct("<4sIQ")
+_ROW = struct.Struct("<QiQ")
+
+
+def _hash64(data: bytes, key: bytes = b"") -> int:
+    return int.from_bytes(hashlib.blake2b(data, digest_size=8, key=key).digest(), "little")
+
+
+class TokenCountCache:
+
+    def __init__(self, path: str, max_entries: int = 0, compact_ratio: float = 0.25, keep_unseen: bool = False):
+        self.path = Path(path)
+        self.max_entries = max_entries
+        self.compact_ratio = compact_ratio
+        self.keep_unseen = keep_unseen
+
+        self.keys = array("Q")
+        self.counts = array("i")
+        self.defs = array("Q")
+        self.tail: Dict[int, Tuple[int, int]] = {}
+
+        self._seen_sorted = bytearray()
+        self._seen_tail = set()
+        self._pending = bytearray()
+        self._load()
+
+    def _load(self) -> None:
+        if not self.path.exists():
+            self.path.write_bytes(_HEADER.pack(MAGIC, 0, 0))
+            return
+
+        data = self.path.read_bytes()
+        magic, _, n = _HEADER.unpack_from(data)
+        if magic != MAGIC:
+            raise ValueError(f"{self.path} is not a token count cache")
+
+        pos = _HEADER.size
+        for arr in (self.keys, self.counts, self.defs):
+            size = n * arr.itemsize
+            arr.frombytes(data[pos:pos + size])
+            pos += size
+
+        # a torn last row (interrupted append) is ignored
+        end = pos + (len(data) - pos) // _ROW.size * _ROW.size
+        for key, count, definition in _ROW.iter_unpack(data[pos:end]):
+            self.tail[key] = (count, definition)
+
+        self._seen_sorted = bytearray(n)
+
+    def __len__(self) -> int:
+        return len(self.keys) + len(self.tail)
+
+    def get(self, key: int) -> Tuple[int, int] | None:
+        hit = self.tail.get(key)
+        if hit is not None:
+            self._seen_tail.add(key)
+            return hit
+
+        i = bisect_left(self.keys, key)
+        if i < len(self.keys) and self.keys[i] == key:
+            self._seen_sorted[i] = 1
+            return self.counts[i], self.defs[i]
+        return None
+
+    def add(self, key: int, count: int, definition: int) -> None:
+        self.tail[key] = (count, definition)
+        self._seen_tail.add(key)
+        self._pending += _ROW.pack(key, count, definition)
+        if len(self._pending) >= 1 << 20:
+            self.flush()
+
+    def flush(self) -> None:
+        if self._pending:
+            with self.path.open("ab") as f:
+                f.write(self._pending)
+            self._pending.clear()
+
+    def compact(self, max_entries: int = 0, evict_unseen: bool = False) -> None:
+        """
+        Rewrites the file as one sorted region. evict_unseen drops every entry
+        not looked up or added in this run. With max_entries, keeps at most that
+        many entries: unseen ones go first, then the oldest (the sorted region
+        before the tail, the tail in append order).
+        """
+        rows: Dict[int, Tuple[int, int, bool]] = {}  # oldest first
+        for i, key in enumerate(self.keys):
+            rows[key] = (self.counts[i], self.defs[i], bool(self._seen_sorted[i]))
+        for key, (count, definition) in self.tail.items():
+            rows[key] = (count, definition, key in self._seen_tail)
+
+        if evict_unseen:
+            rows = {key: row for key, row in rows.items() if row[2]}
+
+        excess = len(rows) - max_entries if max_entries else 0
+        if excess > 0:
+            unseen = [key for key, (_, _, seen) in rows.items() if not seen]
+            for key in unseen[:excess]:
+                del rows[key]
+            excess -= min(excess, len(unseen))
+            for key in list(islice(rows, excess)):
+                del rows[key]
+
+        keys = array("Q", sorted(rows))
+        counts = array("i", (rows[k][0] for k in keys))
+        defs = array("Q", (rows[k][1] for k in keys))
+
+        tmp = self.path.with_suffix(self.path.suffix + ".tmp")
+        with tmp.open("wb") as f:
+            f.write(_HEADER.pack(MAGIC, 0, len(keys)))
+            f.write(keys.tobytes())
+            f.write(counts.tobytes())
+            f.write(defs.tobytes())
+        tmp.replace(self.path)
+
+        self.keys, self.counts, self.defs = keys, counts, defs
+        self.tail = {}
+        self._pending.clear()
+        self._seen_sorted = bytearray(rows[k][2] for k in keys)
+        self._seen_tail = set()
+
+    def close(self, complete: bool = True) -> None:
+        # complete=False (an interrupted run): lines not read yet are not stale
+        evict = complete and not self.keep_unseen
+        stale = len(self) - self._seen_sorted.count(1) - len(self._seen_tail) if evict else 0
+        over = self.max_entries and len(self) > self.max_entries
+        if (over or stale > self.compact_ratio * len(self)
+                or len(self.tail) > self.compact_ratio * max(len(self.keys), 1)):
+            self.compact(self.max_entries, evict_unseen=evict)
+        else:
+            self.flush()
+
+
+def cached_count_jsonl_tokens(
+    path: str,
+    cache_path: str,
+    tokenizer: str | None = None,
+    chunk_size: int = 1024,
+    max_entries: int = 0,
+    on_duplicate: Callable[[str], None] | None = None,
+    keep_unseen: bool = False,
+) -> Tuple[int, int, int]:
+    """
+    Same totals as token_count.count_jsonl_tokens(); on_duplicate gets every
+    repeated "definition..." string, in file order, like main.main() prints them.
+    Cache entries of lines no longer in the file are dropped unless keep_unseen.
+    """
+    name = normalize_name(tokenizer)
+    key_salt = name.encode("utf-8")
+    encode_batch = get_batch_token_encoder(name)
+    cache = TokenCountCache(cache_path, max_entries, keep_unseen=keep_unseen)
+
+    decode, make_text, hash_line = get_field_decoder(TEXT_FIELDS), join_text, _hash64
+    lines = iter_lines(path)
+    prof = active_profiler()
+    if prof is not None:
+        decode = prof.timed("parse", decode)
+        make_text = prof.timed("concat", make_text)
+        hash_line = prof.timed("hash", hash_line)
+        encode_batch = prof.timed("tokenize", encode_batch, records=len)
+        lines = prof.timed_iter("read", lines, bytes_read=len)
+
+    total_tokens = 0
+    total_items = 0
+    max_tokens = 0
+    seen_defs = set()
+    pending_keys: List[Tuple[int, int]] = []
+    pending_texts: List[str] = []
+
+    def add_count(count: int) -> None:
+        nonlocal total_tokens, total_items, max_tokens
+        if count >= 0:
+            total_tokens += count
+            total_items += 1
+            max_tokens = max(max_tokens, count)
+
+    def flush_pending() -> None:
+        for (key, definition), count in zip(pending_keys, encode_batch(pending_texts)):
+            cache.add(key, count, definition)
+            add_count(count)
+        pending_keys.clear()
+        pending_texts.clear()
+
+    complete = False
+    try:
+        for line in lines:
+            key = hash_line(line, key_salt)
+            hit = cache.get(key)
+            definition = None
+
+            if hit is None:
+                definition, example = decode(line)
+                def_hash = 0
+                if definition and definition.find("definition") == 0:
+                    def_hash = _hash64(definition.encode("utf-8")) or 1
+                text = make_text(definition, example)
+                if text is None:
+                    cache.add(key, -1, def_hash)
+                else:
+                    pending_keys.append((key, def_hash))
+                    pending_texts.append(text)
+                    if len(pending_texts) >= chunk_size:
+                        flush_pending()
+            else:
+                count, def_hash = hit
+                add_count(count)
+
+            if def_hash:
+                if def_hash in seen_defs:
+                    if on_duplicate is not None:
+                        if definition is None:
+                            definition = decode(line)[0]
+                        on_duplicate(definition)
+                else:
+                    seen_defs.add(def_hash)
+
+        if pending_texts:
+            flush_pending()
+        complete = True
+    finally:
+        cache.close(complete)
+
+    return total_tokens, total_items, max_tokens
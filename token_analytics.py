@@ -0,0 +1,304 @@
+"""
+Token-ID frequency, headword split and coverage analytics (see main.analytics).
+
+Every record's full sequence (jsonl_stats.build_sequence) is tokenized in
+batches and its ids are added to one count per vocabulary entry, so memory is
+fixed at vocab_size counters however large the corpus is. With NumPy the counts
+are an int64 array updated with one np.bincount per batch; without it they are
+an array("Q") updated in a Python loop (same results, slower).
+
+Headwords (the quoted word of "question" / "definition" / "meaning", see
+shuffle_split.headword) are tokenized as they appear in running text, " word",
+and their token lengths histogrammed. Consecutive repeats are skipped, since
+generate.py writes all templates of a verb together. The coverage curve
+records (records, tokens, distinct ids used) every coverage_every records,
+rounded up to whole chunks.
+
+Counts of shards made in parallel merge exactly (counts and histograms add up,
+the coverage curve gets one point per merged shard):
+
+    python token_analytics.py count verbs_sft-00000.jsonl --out part0
+    python token_analytics.py count verbs_sft-00001.jsonl --out part1
+    python token_analytics.py merge part0 part1 --out all
+    python token_analytics.py report all --top 30 --tail 30
+"""
+import argparse
+import heapq
+import json
+import sys
+from array import array
+from itertools import chain
+from multiprocessing import Pool
+from pathlib import Path
+from typing import Callable, Dict, List, Sequence, Tuple
+
+from encoders import get_backend
+from jsonl_stats import build_sequence, detect_schema, iter_records
+from shuffle_split import headword
+from token_count import iter_chunks
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+FORMAT_VERSION = 1
+
+
+class TokenFrequencies:
+
+    def __init__(self, vocab_size: int, tokenizer: str = ""):
+        self.vocab_size = vocab_size
+        self.tokenizer = tokenizer
+        self.counts = np.zeros(vocab_size, np.int64) if np is not None else array("Q", bytes(8 * vocab_size))
+        self.records = 0
+        self.tokens = 0
+        self.headwords = 0
+        self.headword_tokens: Dict[int, int] = {}           # token length -> headwords
+        self.coverage: List[Tuple[int, int, int]] = []      # (records, tokens, distinct ids)
+
+    def add(self, batch: List[List[int]]) -> None:
+        n = sum(map(len, batch))
+        if np is not None:
+            ids = np.fromiter(chain.from_iterable(batch), np.int64, n)
+            self.counts += np.bincount(ids, minlength=self.vocab_size)
+        else:
+            counts = self.counts
+            for ids in batch:
+                for i in ids:
+                    counts[i] += 1
+        self.records += len(batch)
+        self.tokens += n
+
+    def add_headwords(self, batch: List[List[int]]) -> None:
+        hist = self.headword_tokens
+        for ids in batch:
+            hist[len(ids)] = hist.get(len(ids), 0) + 1
+        self.headwords += len(batch)
+
+    def distinct(self) -> int:
+        if np is not None:
+            return int(np.count_nonzero(self.counts))
+        return sum(1 for c in self.counts if c)
+
+    def checkpoint(self) -> None:
+        point = (self.records, self.tokens, self.distinct())
+        if not self.coverage or self.coverage[-1] != point:
+            self.coverage.append(point)
+
+    def merge(self, other: "TokenFrequencies") -> None:
+        if (other.vocab_size, other.tokenizer) != (self.vocab_size, self.tokenizer):
+            raise ValueError(f"cannot merge {other.tokenizer} counts into {self.tokenizer} counts")
+        if np is not None:
+            self.counts += other.counts
+        else:
+            self.counts = array("Q", map(sum, zip(self.counts, other.counts)))
+        self.records += other.records
+        self.tokens += other.tokens
+        self.headwords += other.headwords
+        for n, c in other.headword_tokens.items():
+            self.headword_tokens[n] = self.headword_tokens.get(n, 0) + c
+        self.checkpoint()
+
+    # --------- reports ---------
+
+    def top_k(self, k: int) -> List[Tuple[int, int]]:
+        k = min(k, self.vocab_size)
+        if np is not None:
+            idx = np.argpartition(-self.counts, k - 1)[:k] if k else []
+            return sorted(((int(i), int(self.counts[i])) for i in idx), key=lambda t: (-t[1], t[0]))
+        return [(i, self.counts[i]) for i in heapq.nsmallest(k, range(self.vocab_size), key=lambda i: (-self.counts[i], i))]
+
+    def rarest(self, k: int) -> List[Tuple[int, int]]:
+        # least frequent ids that occur at all
+        used = [(c, i) for i, c in enumerate(self.counts) if c] if np is None else \
+            [(int(self.counts[i]), int(i)) for i in np.flatnonzero(self.counts)]
+        return [(i, c) for c, i in heapq.nsmallest(k, used)]
+
+    def long_tail(self) -> dict:
+        counts = sorted((int(c) for c in self.counts if c), reverse=True) if np is None else \
+            np.sort(self.counts[self.counts > 0])[::-1].tolist()
+        used = len(counts)
+
+        def share(top: int) -> float:
+            return round(sum(counts[:top]) / self.tokens, 4) if self.tokens else 0.0
+
+        return {
+            "vocab_size": self.vocab_size,
+            "used": used,
+            "unused": self.vocab_size - used,
+            "singletons": sum(1 for c in counts if c == 1),
+            "at_most_5": sum(1 for c in counts if c <= 5),
+            # share of all tokens taken by the most frequent 1% / 10% of the used ids
+            "top_1pct_share": share(max(used // 100, 1)),
+            "top_10pct_share": share(max(used // 10, 1)),
+        }
+
+    def report(self, decode: Callable[[List[int]], str] | None = None, top: int = 20, tail: int = 20) -> dict:
+        def rows(pairs):
+            return [{"id": i, "count": c, "token": decode([i]) if decode else None} for i, c in pairs]
+
+        multi = sum(c for n, c in self.headword_tokens.items() if n > 1)
+        return {
+            "tokenizer": self.tokenizer,
+            "records": self.records,
+            "tokens": self.tokens,
+            "long_tail": self.long_tail(),
+            "headwords": {
+                "count": self.headwords,
+                "multi_token": multi,
+                "multi_token_share": round(multi / self.headwords, 4) if self.headwords else 0.0,
+                "tokens": {str(n): c for n, c in sorted(self.headword_tokens.items())},
+            },
+            "coverage": [{"records": r, "tokens": t, "distinct": d} for r, t, d in self.coverage],
+            "top": rows(self.top_k(top)),
+            "rarest": rows(self.rarest(tail)),
+        }
+
+    # --------- files: <path>.bin (uint64 counts, little endian) + <path>.json ---------
+
+    def save(self, path: str) -> None:
+        if np is not None:
+            self.counts.astype("<u8").tofile(path + ".bin")
+        else:
+            counts = array("Q", self.counts)
+            if sys.byteorder == "big":
+                counts.byteswap()
+            Path(path + ".bin").write_bytes(counts.tobytes())
+        meta = {
+            "version": FORMAT_VERSION,
+            "tokenizer": self.tokenizer,
+            "vocab_size": self.vocab_size,
+            "records": self.records,
+            "tokens": self.tokens,
+            "headwords": self.headwords,
+            "headword_tokens": {str(n): c for n, c in sorted(self.headword_tokens.items())},
+            "coverage": self.coverage,
+        }
+        Path(path + ".json").write_text(json.dumps(meta) + "\n", encoding="utf-8")
+
+    @classmethod
+    def load(cls, path: str) -> "TokenFrequencies":
+        meta = json.loads(Path(path + ".json").read_text(encoding="utf-8"))
+        if meta["version"] != FORMAT_VERSION:
+            raise ValueError(f"{path}: unsupported counts version {meta['version']}")
+        freq = cls(meta["vocab_size"], meta["tokenizer"])
+        if np is not None:
+            freq.counts = np.fromfile(path + ".bin", "<u8").astype(np.int64)
+        else:
+            freq.counts = array("Q", Path(path + ".bin").read_bytes())
+            if sys.byteorder == "big":
+                freq.counts.byteswap()
+        if len(freq.counts) != freq.vocab_size:
+            raise ValueError(f"{path}.bin holds {len(freq.counts)} counts, expected {freq.vocab_size}")
+        freq.records = meta["records"]
+        freq.tokens = meta["tokens"]
+        freq.headwords = meta["headwords"]
+        freq.headword_tokens = {int(n): c for n, c in meta["headword_tokens"].items()}
+        freq.coverage = [tuple(p) for p in meta["coverage"]]
+        return freq
+
+
+def count_jsonl(path: str, tokenizer: str | None = None, chunk_size: int = 1024,
+                coverage_every: int = 10_000) -> TokenFrequencies:
+    backend = get_backend(tokenizer)
+    freq = TokenFrequencies(backend.vocab_size, backend.name)
+    last = None
+    next_point = coverage_every
+
+    for chunk in iter_chunks(iter_records(path), chunk_size):
+        texts = [build_sequence(obj, detect_schema(obj)) for obj in chunk]
+        for obj in chunk:
+            word = headword(obj.get("question"), obj.get("definition"), obj.get("meaning"), obj.get("verb"))
+            if word is not None and word != last:
+                texts.append(" " + word)
+            last = word
+
+        # sequences and headwords in one batch call
+        ids = backend.encode_batch(texts)
+        freq.add(ids[:len(chunk)])
+        freq.add_headwords(ids[len(chunk):])
+        if freq.records >= next_point:
+            freq.checkpoint()
+            next_point = freq.records + coverage_every
+
+    freq.checkpoint()
+    return freq
+
+
+def _count_task(args: tuple) -> TokenFrequencies:
+    return count_jsonl(*args)
+
+
+def count_files(paths: Sequence[str], tokenizer: str | None = None, chunk_size: int = 1024,
+                coverage_every: int = 10_000, workers: int = 0) -> TokenFrequencies:
+    # one file per task; results are merged in path order
+    tasks = [(p, tokenizer, chunk_size, coverage_every) for p in paths]
+    if workers > 0 and len(tasks) > 1:
+        with Pool(min(workers, len(tasks))) as pool:
+            parts = pool.map(_count_task, tasks)
+    else:
+        parts = map(_count_task, tasks)
+
+    total = None
+    for part in parts:
+        if total is None:
+            total = part
+        else:
+            total.merge(part)
+    return total
+
+
+def print_report(report: dict) -> None:
+    print(f"{report['tokenizer']}: records = {report['records']}, tokens = {report['tokens']}")
+    print(f"  long tail  {json.dumps(report['long_tail'])}")
+    print(f"  headwords  {json.dumps(report['headwords'])}")
+    for point in report["coverage"]:
+        print(f"  coverage   records = {point['records']:>10}, tokens = {point['tokens']:>12}, distinct = {point['distinct']}")
+    for title in ("top", "rarest"):
+        print(f"  {title}:")
+        for row in report[title]:
+            print(f"    {row['id']:>7} {row['count']:>12}  {row['token']!r}")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    sub = parser.add_subparsers(dest="cmd", required=True)
+    p_count = sub.add_parser("count")
+    p_count.add_argument("paths", nargs="+")
+    p_count.add_argument("--out", required=True)
+    p_count.add_argument("--tokenizer", default="gpt2")
+    p_count.add_argument("--chunk-size", type=int, default=1024)
+    p_count.add_argument("--coverage-every", type=int, default=10_000)
+    p_count.add_argument("--workers", type=int, default=0, help="> 0: one process per input file")
+    p_merge = sub.add_parser("merge")
+    p_merge.add_argument("parts", nargs="+")
+    p_merge.add_argument("--out", required=True)
+    p_report = sub.add_parser("report")
+    p_report.add_argument("path")
+    p_report.add_argument("--top", type=int, default=20)
+    p_report.add_argument("--tail", type=int, default=20)
+    p_report.add_argument("--json", action="store_true")
+    args = parser.parse_args()
+
+    if args.cmd == "count":
+        freq = count_files(args.paths, args.tokenizer, args.chunk_size, args.coverage_every, args.workers)
+        freq.save(args.out)
+        print(f"{args.out}: {freq.records} records, {freq.tokens} tokens, {freq.distinct()} distinct ids")
+    elif args.cmd == "merge":
+        freq = TokenFrequencies.load(args.parts[0])
+        for part in args.parts[1:]:
+            freq.merge(TokenFrequencies.load(part))
+        freq.save(args.out)
+        print(f"{args.out}: {freq.records} records, {freq.tokens} tokens, {freq.distinct()} distinct ids")
+    else:
+        freq = TokenFrequencies.load(args.path)
+        report = freq.report(get_backend(freq.tokenizer).decode, args.top, args.tail)
+        if args.json:
+            print(json.dumps(report))
+        else:
+            print_report(report)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+"""
+Batched, optionally multi-process token counting over JSONL records.
+
+Texts are grouped into chunks and each chunk is encoded with a single batch call
+(GPT2TokenizerFast on a list / tiktoken encode_batch). With workers > 0 the chunks
+are spread over a process pool; every worker loads its own tokenizer once.
+"""
+from itertools import islice
+from multiprocessing import Pool
+from typing import Callable, Iterable, Iterator, List, Tuple
+
+from encoders import get_batch_token_encoder
+from jsonl_reader import get_field_decoder, iter_lines
+from profiling import active_profiler
+
+
+TEXT_FIELDS = ("definition", "example")
+
+
+def join_text(definition: str | None, example: str | None) -> str | None:
+    # the text main.main() counts: "<definition>: <example>" or just "<example>"
+    if example is None or example == "":
+        return None
+    if definition is not None:
+        return definition + ": " + example
+    return example
+
+
+def record_text(obj: dict) -> str | None:
+    return join_text(obj.get("definition", None), obj.get("example"))
+
+
+def iter_record_texts(path: str, on_definition: Callable[[str], None] | None = None) -> Iterator[str]:
+    # only the two fields are decoded (see jsonl_reader)
+    decode, make_text = get_field_decoder(TEXT_FIELDS), join_text
+    lines = iter_lines(path)
+    prof = active_profiler()
+    if prof is not None:
+        decode = prof.timed("parse", decode)
+        make_text = prof.timed("concat", make_text)
+        lines = prof.timed_iter("read", lines, bytes_read=len)
+
+    for line in lines:
+        definition, example = decode(line)
+
+        if on_definition is not None:
+            if (definition is not None) and (definition != ""):
+                on_definition(definition)
+
+        val = make_text(definition, example)
+        if val is not None:
+            yield val
+
+
+def iter_chunks(items: Iterable, size: int) -> Iterator[list]:
+    it = iter(items)
+    while True:
+        chunk = list(islice(it, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+# --------- worker side ---------
+
+_worker_encoder = None
+
+
+def _init_worker(tokenizer: str | None) -> None:
+    global _worker_encoder
+    _worker_encoder = get_batch_token_encoder(tokenizer)
+
+
+def _count_chunk(texts: List[str]) -> Tuple[int, int, int]:
+    counts = _worker_encoder(texts)
+    return sum(counts), len(counts), max(counts, default=0)
+
+
+# --------- public API ---------
+
+def count_tokens(
+    texts: Iterable[str],
+    tokenizer: str | None = None,
+    chunk_size: int = 1024,
+    workers: int = 0,
+) -> Tuple[int, int, int]:
+    """
+    Returns (total_tokens, total_items, max_tokens) for the given texts.
+    workers == 0 encodes in the current process.
+    """
+    total_tokens = 0
+    total_items = 0
+    max_tokens = 0
+
+    chunks = iter_chunks(texts, chunk_size)
+    prof = active_profiler()
+
+    if workers <= 0:
+        _init_worker(tokenizer)
+        count_chunk = _count_chunk if prof is None else prof.timed("tokenize", _count_chunk, records=len)
+        results = map(count_chunk, chunks)
+        pool = None
+    else:
+        pool = Pool(workers, initializer=_init_worker, initargs=(tokenizer,))
+        results = pool.imap(_count_chunk, chunks)
+        if prof is not None:
+            # time spent waiting on the pool (includes feeding it from this process)
+            results = prof.timed_iter("tokenize_wait", results, records=lambda r: r[1])
+
+    try:
+        for tokens, items, longest in results:
+            total_tokens += tokens
+            total_items += items
+            max_tokens = max(max_tokens, longest)
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+
+    return total_tokens, total_items, max_tokens
+
+
+def count_jsonl_tokens(
+    path: str,
+    tokenizer: str | None = None,
+    chunk_size: int = 1024,
+    workers: int = 0,
+    on_definition: Callable[[str], None] | None = None,
+) -> Tuple[int, int, int]:
+    texts = iter_record_texts(path, on_definition)
+    return count_tokens(texts, tokenizer, chunk_size, workers)
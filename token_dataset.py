@@ -0,0 +1,168 @@
+"""
+Pre-tokenized, memory-mapped dataset format.
+
+export_jsonl() tokenizes a JSONL file once and writes three files:
+
+    <out>.bin   token ids of all records back to back (uint16, or uint32 for big vocabularies)
+    <out>.idx   uint64 offsets[n + 1] followed by uint32 prompt_lens[n]
+    <out>.json  metadata header: tokenizer, vocab size, dtype, record count, ...
+
+Each record is the prompt (all sequence fields but the last, joined with the
+schema separator) followed by the target field, so tokens[:prompt_len] is the
+part to mask out of the loss. TokenDataset mmaps .bin/.idx and hands out
+zero-copy memoryview slices.
+
+    python token_dataset.py wordacy-train.jsonl wordacy-train --tokenizer tiktoken
+"""
+import argparse
+import json
+import mmap
+import sys
+from array import array
+from pathlib import Path
+from typing import Iterator, List, Tuple
+
+from encoders import get_backend
+from jsonl_stats import SCHEMAS, detect_schema, iter_records
+from token_count import iter_chunks
+
+FORMAT_VERSION = 1
+
+
+def split_record(obj: dict, schema: str | None = None) -> Tuple[str, str]:
+    # (prompt, target) in the same field order jsonl_stats uses for the full sequence
+    name = schema or detect_schema(obj)
+    _, seq_fields, sep = SCHEMAS[name]
+
+    prompt = sep.join(v for v in (obj.get(k) or "" for k in seq_fields[:-1]) if v)
+    target = obj.get(seq_fields[-1]) or ""
+    if prompt and target:
+        prompt += sep
+    return prompt, target
+
+
+def _paths(out: str) -> Tuple[Path, Path, Path]:
+    return Path(out + ".bin"), Path(out + ".idx"), Path(out + ".json")
+
+
+def export_jsonl(in_path: str, out: str, tokenizer: str | None = None,
+                 schema: str | None = None, chunk_size: int = 1024) -> dict:
+    backend = get_backend(tokenizer)
+    typecode = "H" if backend.vocab_size <= 0xFFFF else "I"
+    bin_path, idx_path, meta_path = _paths(out)
+
+    offsets = array("Q", [0])
+    prompt_lens = array("I")
+
+    with bin_path.open("wb") as fbin:
+        for chunk in iter_chunks(iter_records(in_path), chunk_size):
+            texts: List[str] = []
+            for obj in chunk:
+                texts.extend(split_record(obj, schema))
+
+            ids = backend.encode_batch(texts)
+            buf = array(typecode)
+            for i in range(0, len(ids), 2):
+                prompt, target = ids[i], ids[i + 1]
+                buf.extend(prompt)
+                buf.extend(target)
+                prompt_lens.append(len(prompt))
+                offsets.append(offsets[-1] + len(prompt) + len(target))
+            fbin.write(buf.tobytes())
+
+    with idx_path.open("wb") as fidx:
+        fidx.write(offsets.tobytes())
+        fidx.write(prompt_lens.tobytes())
+
+    meta = {
+        "version": FORMAT_VERSION,
+        "source": str(in_path),
+        "tokenizer": backend.name,
+        "vocab_size": backend.vocab_size,
+        "dtype": "uint16" if typecode == "H" else "uint32",
+        "byteorder": sys.byteorder,
+        "records": len(prompt_lens),
+        "tokens": offsets[-1],
+        "layout": "prompt + target; loss on tokens[prompt_len:]",
+    }
+    meta_path.write_text(json.dumps(meta, indent=2), encoding="utf-8")
+    return meta
+
+
+class TokenDataset:
+    """
+    Random access to an exported dataset: ds[i] is a memoryview of token ids,
+    ds.prompt_len(i) is where the target starts. Slices are views into the
+    mapped file: copy them (list(), bytes()) if they must outlive close().
+    """
+
+    def __init__(self, path: str):
+        bin_path, idx_path, meta_path = _paths(path)
+        self.meta = json.loads(meta_path.read_text(encoding="utf-8"))
+        if self.meta["byteorder"] != sys.byteorder:
+            raise ValueError(f"{bin_path} was written on a {self.meta['byteorder']}-endian machine")
+
+        n = self.meta["records"]
+        typecode = "H" if self.meta["dtype"] == "uint16" else "I"
+
+        self._fbin = bin_path.open("rb")
+        self._fidx = idx_path.open("rb")
+        # mmap rejects empty files
+        self._mbin = mmap.mmap(self._fbin.fileno(), 0, access=mmap.ACCESS_READ) if self.meta["tokens"] else None
+        self._midx = mmap.mmap(self._fidx.fileno(), 0, access=mmap.ACCESS_READ)
+
+        self.tokens = memoryview(self._mbin).cast(typecode) if self._mbin else memoryview(array(typecode))
+        idx = memoryview(self._midx)
+        self.offsets = idx[:(n + 1) * 8].cast("Q")
+        self.prompt_lens = idx[(n + 1) * 8:].cast("I")
+
+    def __len__(self) -> int:
+        return len(self.prompt_lens)
+
+    def __getitem__(self, i: int) -> memoryview:
+        n = len(self)
+        if i < 0:
+            i += n
+        if not 0 <= i < n:
+            raise IndexError("TokenDataset index out of range")
+        return self.tokens[self.offsets[i]:self.offsets[i + 1]]
+
+    def __iter__(self) -> Iterator[memoryview]:
+        for i in range(len(self)):
+            yield self[i]
+
+    def prompt_len(self, i: int) -> int:
+        return self.prompt_lens[i]
+
+    def close(self) -> None:
+        # views must be released before the maps can be closed
+        self.tokens.release()
+        self.offsets.release()
+        self.prompt_lens.release()
+        for m in (self._mbin, self._midx):
+            if m is not None:
+                m.close()
+        self._fbin.close()
+        self._fidx.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("in_path")
+    parser.add_argument("out", help="output prefix, writes <out>.bin/.idx/.json")
+    parser.add_argument("--tokenizer", default="gpt2")
+    parser.add_argument("--schema", choices=sorted(SCHEMAS))
+    args = parser.parse_args()
+
+    meta = export_jsonl(args.in_path, args.out, args.tokenizer, args.schema)
+    print(f"{args.out}: records = {meta['records']}, tokens = {meta['tokens']}, dtype = {meta['dtype']}")
+
+
+if __name__ == "__main__":
+    main()
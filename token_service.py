@@ -0,0 +1,333 @@
+"""
+Local tokenization service: warm tokenizers shared by many jobs, with request batching.
+
+    python token_service.py serve --tokenizers gpt2 tiktoken              # Unix socket (DEFAULT_ADDRESS)
+    python token_service.py serve --address 127.0.0.1:7741 --max-latency-ms 2
+    WORDACY_TOKEN_SERVICE=127.0.0.1:7741 python main.py                    # get_token_encoder() uses it
+
+Protocol: one JSON object per line in each direction, over a Unix socket
+(address is a path) or localhost TCP (address is host:port):
+
+    -> {"id": 1, "op": "count" | "encode", "tokenizer": "gpt2", "texts": ["...", ...]}
+    <- {"id": 1, "counts": [3, ...]}   /   {"id": 1, "ids": [[464, ...], ...]}   /   {"id": 1, "error": "..."}
+    -> {"id": 2, "op": "info"}
+    <- {"id": 2, "info": {...}}
+
+Requests for one tokenizer are queued and merged into micro-batches: a batch
+is cut when it holds max_batch texts or max_latency after its first request,
+whichever comes first, and encoded with one encode_batch call in that
+tokenizer's worker thread (texts must be a list of strings, checked before a
+request joins a batch; if a batch still fails, each of its requests is
+encoded on its own so only the failing one gets the error). Requests on one
+connection may be pipelined; responses carry the request id and can come
+back out of order.
+
+TokenClient is the synchronous client (one connection per thread).
+get_service_token_encoder() / get_service_batch_token_encoder() return
+drop-in replacements for the encoders.get_token_encoder() lambdas.
+"""
+import argparse
+import asyncio
+import json
+import os
+import socket
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Tuple
+
+from encoders import get_backend, normalize_name
+
+DEFAULT_ADDRESS = os.path.join(tempfile.gettempdir(), "wordacy-tokens.sock")
+MAX_LINE = 64 << 20
+
+
+def _is_tcp(address: str) -> bool:
+    host, sep, port = address.rpartition(":")
+    return bool(sep) and port.isdigit() and "/" not in address
+
+
+# --------- server ---------
+
+class Batcher:
+
+    def __init__(self, tokenizer: str, max_batch: int = 256, max_latency: float = 0.002):
+        self.tokenizer = tokenizer
+        self.max_batch = max_batch
+        self.max_latency = max_latency
+        self.queue: asyncio.Queue = asyncio.Queue()
+        # tokenizer calls stay on one thread; backends release the GIL while encoding
+        self.executor = ThreadPoolExecutor(1)
+        self.stats = {"requests": 0, "texts": 0, "batches": 0, "max_batch_texts": 0}
+
+    async def submit(self, texts: List[str]) -> List[List[int]]:
+        fut = asyncio.get_running_loop().create_future()
+        await self.queue.put((texts, fut))
+        return await fut
+
+    async def _collect(self) -> List[Tuple[List[str], asyncio.Future]]:
+        loop = asyncio.get_running_loop()
+        items = [await self.queue.get()]
+        n = len(items[0][0])
+        deadline = loop.time() + self.max_latency
+        while n < self.max_batch:
+            try:
+                item = self.queue.get_nowait()
+            except asyncio.QueueEmpty:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(self.queue.get(), remaining)
+                except asyncio.TimeoutError:
+                    break
+            items.append(item)
+            n += len(item[0])
+        return items
+
+    def _encode(self, texts: List[str]) -> List[List[int]]:
+        # get_backend() is cached; a tokenizer that fails to load fails every batch
+        return get_backend(self.tokenizer).encode_batch(texts)
+
+    async def load(self) -> None:
+        await asyncio.get_running_loop().run_in_executor(self.executor, get_backend, self.tokenizer)
+
+    async def _encode_each(self, items: List[Tuple[List[str], asyncio.Future]]) -> None:
+        # a failed batch is retried request by request, so only the bad one gets the error
+        loop = asyncio.get_running_loop()
+        for ts, fut in items:
+            try:
+                ids = await loop.run_in_executor(self.executor, self._encode, ts)
+            except Exception as e:
+                if not fut.done():
+                    fut.set_exception(e)
+            else:
+                if not fut.done():
+                    fut.set_result(ids)
+
+    async def run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            items = await self._collect()
+            texts = [t for ts, _ in items for t in ts]
+            try:
+                ids = await loop.run_in_executor(self.executor, self._encode, texts)
+            except Exception as e:
+                if len(items) == 1:
+                    _, fut = items[0]
+                    if not fut.done():
+                        fut.set_exception(e)
+                else:
+                    await self._encode_each(items)
+                continue
+
+            pos = 0
+            for ts, fut in items:
+                if not fut.done():
+                    fut.set_result(ids[pos:pos + len(ts)])
+                pos += len(ts)
+
+            st = self.stats
+            st["requests"] += len(items)
+            st["texts"] += len(texts)
+            st["batches"] += 1
+            st["max_batch_texts"] = max(st["max_batch_texts"], len(texts))
+
+
+class TokenService:
+
+    def __init__(self, max_batch: int = 256, max_latency: float = 0.002):
+        self.max_batch = max_batch
+        self.max_latency = max_latency
+        self.batchers: Dict[str, Batcher] = {}
+        self._tasks: List[asyncio.Task] = []
+        self.started = time.time()
+
+    def batcher(self, tokenizer: str | None) -> Batcher:
+        name = normalize_name(tokenizer)
+        b = self.batchers.get(name)
+        if b is None:
+            b = self.batchers[name] = Batcher(name, self.max_batch, self.max_latency)
+            self._tasks.append(asyncio.create_task(b.run()))
+        return b
+
+    def info(self) -> dict:
+        return {
+            "pid": os.getpid(),
+            "uptime_s": round(time.time() - self.started, 3),
+            "max_batch": self.max_batch,
+            "max_latency_ms": self.max_latency * 1000,
+            "tokenizers": {name: b.stats for name, b in self.batchers.items()},
+        }
+
+    async def _request(self, req: dict, writer: asyncio.StreamWriter) -> None:
+        resp = {"id": req.get("id")}
+        try:
+            op = req.get("op")
+            if op == "info":
+                resp["info"] = self.info()
+            elif op in ("count", "encode"):
+                texts = req.get("texts")
+                # checked here: anything else would fail the whole micro-batch it joins
+                if not isinstance(texts, list) or not all(isinstance(t, str) for t in texts):
+                    raise ValueError("texts must be a list of strings")
+                ids = await self.batcher(req.get("tokenizer")).submit(texts)
+                if op == "count":
+                    resp["counts"] = [len(x) for x in ids]
+                else:
+                    resp["ids"] = [list(x) for x in ids]
+            else:
+                raise ValueError(f"unknown op: {op}")
+        except Exception as e:
+            resp["error"] = f"{type(e).__name__}: {e}"
+        writer.write(json.dumps(resp).encode("utf-8") + b"\n")
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        pending = set()
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                try:
+                    req = json.loads(line)
+                    if not isinstance(req, dict):
+                        raise ValueError("not a JSON object")
+                except ValueError as e:
+                    writer.write(json.dumps({"id": None, "error": f"bad request: {e}"}).encode("utf-8") + b"\n")
+                    continue
+                task = asyncio.create_task(self._request(req, writer))
+                pending.add(task)
+                task.add_done_callback(pending.discard)
+                await writer.drain()
+            if pending:
+                await asyncio.gather(*pending)
+            await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def serve(self, address: str = DEFAULT_ADDRESS, preload: List[str] = ()) -> None:
+        for name in preload:
+            await self.batcher(name).load()
+
+        if _is_tcp(address):
+            host, _, port = address.rpartition(":")
+            server = await asyncio.start_server(self._handle, host, int(port), limit=MAX_LINE)
+        else:
+            if os.path.exists(address):
+                os.unlink(address)  # stale socket of a previous run
+            server = await asyncio.start_unix_server(self._handle, address, limit=MAX_LINE)
+
+        print(f"token service listening on {address}", flush=True)
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            for t in self._tasks:
+                t.cancel()
+            if not _is_tcp(address) and os.path.exists(address):
+                os.unlink(address)
+
+
+# --------- client ---------
+
+class TokenClient:
+    """
+    Synchronous client. Safe to share between threads: every thread gets its
+    own connection, opened on first use.
+    """
+
+    def __init__(self, address: str = DEFAULT_ADDRESS, tokenizer: str | None = None, timeout: float = 60.0):
+        self.address = address
+        self.tokenizer = normalize_name(tokenizer)
+        self.timeout = timeout
+        self._local = threading.local()
+
+    def _connect(self):
+        if _is_tcp(self.address):
+            host, _, port = self.address.rpartition(":")
+            sock = socket.create_connection((host, int(port)), self.timeout)
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        else:
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            sock.settimeout(self.timeout)
+            sock.connect(self.address)
+        self._local.conn = (sock, sock.makefile("rb"))
+        self._local.next_id = 0
+        return self._local.conn
+
+    def _call(self, req: dict) -> dict:
+        conn = getattr(self._local, "conn", None) or self._connect()
+        sock, rfile = conn
+        self._local.next_id += 1
+        req["id"] = self._local.next_id
+        try:
+            sock.sendall(json.dumps(req).encode("utf-8") + b"\n")
+            line = rfile.readline()
+        except OSError:
+            self.close()
+            raise
+        if not line:
+            self.close()
+            raise ConnectionError(f"token service at {self.address} closed the connection")
+        resp = json.loads(line)
+        if "error" in resp:
+            raise RuntimeError(resp["error"])
+        return resp
+
+    def count(self, texts: List[str]) -> List[int]:
+        return self._call({"op": "count", "tokenizer": self.tokenizer, "texts": texts})["counts"]
+
+    def encode(self, texts: List[str]) -> List[List[int]]:
+        return self._call({"op": "encode", "tokenizer": self.tokenizer, "texts": texts})["ids"]
+
+    def info(self) -> dict:
+        return self._call({"op": "info"})["info"]
+
+    def close(self) -> None:
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn[1].close()
+            conn[0].close()
+            self._local.conn = None
+
+
+def get_service_token_encoder(tokenizer: str | None = None, address: str = DEFAULT_ADDRESS):
+    client = TokenClient(address, tokenizer)
+    return lambda s: client.count([s])[0]
+
+
+def get_service_batch_token_encoder(tokenizer: str | None = None, address: str = DEFAULT_ADDRESS):
+    client = TokenClient(address, tokenizer)
+    return lambda texts: client.count(texts) if texts else []
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    sub = parser.add_subparsers(dest="cmd", required=True)
+    p_serve = sub.add_parser("serve")
+    p_serve.add_argument("--address", default=os.environ.get("WORDACY_TOKEN_SERVICE", DEFAULT_ADDRESS),
+                         help="Unix socket path or host:port")
+    p_serve.add_argument("--tokenizers", nargs="*", default=["gpt2"], help="loaded at startup")
+    p_serve.add_argument("--max-batch", type=int, default=256)
+    p_serve.add_argument("--max-latency-ms", type=float, default=2.0)
+    p_info = sub.add_parser("info")
+    p_info.add_argument("--address", default=os.environ.get("WORDACY_TOKEN_SERVICE", DEFAULT_ADDRESS))
+    args = parser.parse_args()
+
+    if args.cmd == "info":
+        print(json.dumps(TokenClient(args.address).info()))
+        return
+
+    service = TokenService(args.max_batch, args.max_latency_ms / 1000)
+    try:
+        asyncio.run(service.serve(args.address, args.tokenizers))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
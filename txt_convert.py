@@ -0,0 +1,124 @@
+"""
+Parallel text -> JSONL conversion (see main.txt_to_jsonl).
+
+The input is split into newline-aligned byte ranges of about chunk_bytes each.
+Ranges are converted independently (in a process pool when workers > 0) and
+written back in input order, so the output does not depend on the worker
+count. Lines without " is " go to the reject file instead of the output.
+Byte alignment assumes an ASCII-compatible encoding (utf-8, latin-1, ...).
+"""
+import json
+import os
+import time
+from multiprocessing import Pool
+from typing import Iterator, Tuple
+
+from profiling import active_profiler
+
+CHUNK_BYTES = 8 << 20
+
+
+def convert_line(txt: str) -> dict | None:
+    # "<subject> is ..." -> record, None if the line has no subject
+    pos = txt.find(" is ")
+    if pos <= 0:
+        return None
+    subject = txt[0:pos]
+    return {"verb": "", "meaning": f'definition of "{subject}"', "example": txt}
+
+
+def iter_byte_ranges(path: str, chunk_bytes: int = CHUNK_BYTES) -> Iterator[Tuple[int, int]]:
+    size = os.path.getsize(path)
+    with open(path, "rb") as f:
+        start = 0
+        while start < size:
+            end = start + chunk_bytes
+            if end >= size:
+                end = size
+            else:
+                # move the boundary past the next newline
+                f.seek(end)
+                f.readline()
+                end = f.tell()
+            yield start, end
+            start = end
+
+
+def convert_range(path: str, start: int, end: int, encoding: str = "utf-8") -> Tuple[str, str, int, int]:
+    """
+    Returns (jsonl text, rejected lines, lines read, bytes read) for one byte range.
+    """
+    with open(path, "rb") as f:
+        f.seek(start)
+        data = f.read(end - start)
+
+    # same line splitting as text mode iteration (universal newlines)
+    text = data.decode(encoding).replace("\r\n", "\n").replace("\r", "\n")
+
+    out = []
+    rejects = []
+    lines = 0
+    for line in text.split("\n"):
+        txt = line.strip()
+        if not txt:
+            continue
+        lines += 1
+        rec = convert_line(txt)
+        if rec is None:
+            rejects.append(txt + "\n")
+        else:
+            out.append(json.dumps(rec, ensure_ascii=False) + "\n")
+
+    return "".join(out), "".join(rejects), lines, len(data)
+
+
+def _convert_task(args: tuple) -> Tuple[str, str, int, int]:
+    return convert_range(*args)
+
+
+def convert_file(in_path: str, out_path: str, reject_path: str | None = None, encoding: str = "utf-8",
+                 workers: int = 0, chunk_bytes: int = CHUNK_BYTES) -> dict:
+    tasks = ((in_path, start, end, encoding) for start, end in iter_byte_ranges(in_path, chunk_bytes))
+    stats = {"lines": 0, "records": 0, "rejected": 0, "bytes": 0}
+
+    t0 = time.perf_counter()
+    pool = Pool(workers) if workers > 0 else None
+    results = pool.imap(_convert_task, tasks) if pool else map(_convert_task, tasks)
+
+    fout = open(out_path, "w", encoding=encoding)
+    frej = open(reject_path, "w", encoding=encoding) if reject_path else None
+    write_out = fout.write
+    write_rej = frej.write if frej is not None else None
+
+    prof = active_profiler()
+    if prof is not None:
+        # read + split + convert per byte range (in the workers when workers > 0)
+        results = prof.timed_iter("convert", results, records=lambda r: r[2], bytes_read=lambda r: r[3])
+        encoded_len = lambda s: len(s.encode(encoding))
+        write_out = prof.timed("write", write_out, records=lambda s: s.count("\n"), bytes_written=encoded_len)
+        if write_rej is not None:
+            write_rej = prof.timed("write_rejects", write_rej, records=lambda s: s.count("\n"),
+                                   bytes_written=encoded_len)
+
+    try:
+        for out, rejects, lines, nbytes in results:
+            write_out(out)
+            if write_rej is not None:
+                write_rej(rejects)
+            stats["lines"] += lines
+            stats["rejected"] += rejects.count("\n")
+            stats["bytes"] += nbytes
+    finally:
+        fout.close()
+        if frej is not None:
+            frej.close()
+        if pool is not None:
+            pool.close()
+            pool.join()
+
+    dt = time.perf_counter() - t0
+    stats["records"] = stats["lines"] - stats["rejected"]
+    stats["seconds"] = round(dt, 3)
+    stats["mb_per_s"] = round(stats["bytes"] / (1 << 20) / dt, 2) if dt > 0 else 0.0
+    stats["lines_per_s"] = round(stats["lines"] / dt) if dt > 0 else 0
+    return stats